@@ -6,18 +6,163 @@ FIXED: Properly handles different content types including multipart/form-data
 """
 
 import yaml
+import bisect
 import json
+import os
 import re
+import textwrap
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+# Prefer the libyaml-backed loader when PyYAML was built with it; the
+# pure-Python SafeLoader is an order of magnitude slower on large specs.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Backstop on nesting followed when walking schemas. Recursive component
+# graphs (e.g. Tree -> children: [Tree]) are cut by $ref cycle detection;
+# this only stops inline recursion such as self-referencing YAML aliases, so
+# it sits well above the nesting of any real schema. Truncation is reported.
+_MAX_SCHEMA_DEPTH = 64
+
+# '#/a/b' $ref strings mapped to their path segments; refs that are not in
+# the spec's index (e.g. unresolvable ones) are split only once
+_REF_PARTS_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+# Translation table replacing characters that are not safe in generated
+# file names with '_', and the pattern collapsing the resulting runs
+_UNSAFE_FILENAME_TABLE = str.maketrans({c: '_' for c in '/{}[]<>:"|?*'})
+_UNDERSCORE_RUNS = re.compile(r'_+')
+
+# Section headings of the text diff (text before the first ':') mapped to
+# the result bucket they open
+_DIFF_SECTIONS = {
+    '### New Endpoints': 'added',
+    '### Deleted Endpoints': 'deleted',
+    '### Modified Endpoints': 'modified'
+}
+
+# HTTP verbs recognised as operations of a path item, in emission order
+_HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'head', 'options', 'trace')
+_HTTP_METHOD_SET = frozenset(_HTTP_METHODS)
+_HTTP_METHOD_RANK = {method: rank for rank, method in enumerate(_HTTP_METHODS)}
+
+# Example values keyed on schema format for string fields. 'binary' is
+# handled separately because a 'url' field name takes precedence over it.
+_STRING_FORMAT_EXAMPLES = {
+    'email': "john.doe@example.com",
+    'date': "2024-01-15",
+    'date-time': "2024-01-15T10:30:00Z",
+    'uuid': "550e8400-e29b-41d4-a716-446655440000",
+    'uri': "https://example.com/resource"
+}
+
+# Field-name heuristics as ordered (keyword, example) rules: the first rule
+# whose keyword occurs in the lower-cased field name wins. A tuple example
+# is a nested rule table; an empty keyword always matches.
+_NAME_FIELD_EXAMPLES = (
+    ('first', "John"),
+    ('last', "Doe"),
+    ('file', "@/path/to/video.mp4"),
+    ('', "Daily Diary Entry")
+)
+
+_STRING_FIELD_EXAMPLES = (
+    ('email', "john.doe@example.com"),
+    ('name', _NAME_FIELD_EXAMPLES),
+    ('title', "Today's Activities"),
+    ('description', "Students worked on math problems and participated in group discussions"),
+    ('phone', "+1-234-567-8900"),
+    ('address', "123 Main St, City, State 12345"),
+    ('id', "123"),
+    ('status', "active"),
+    ('type', "standard"),
+    ('date', "2024-01-15"),
+    ('time', "10:30:00"),
+    ('file', "@/path/to/file"),
+    ('video', "@/path/to/file"),
+    ('image', "@/path/to/file")
+)
+
+_INTEGER_FIELD_EXAMPLES = (
+    ('id', 123),
+    ('count', 25),
+    ('total', 25),
+    ('score', 85),
+    ('age', 28)
+)
+
+_NUMBER_FIELD_EXAMPLES = (
+    ('price', 29.99),
+    ('cost', 29.99),
+    ('rate', 4.5),
+    ('percentage', 75.5)
+)
+
+_BOOLEAN_FIELD_EXAMPLES = (
+    ('active', True),
+    ('enabled', True),
+    ('deleted', False),
+    ('disabled', False)
+)
+
+# Notice written in place of the curl file of a deleted endpoint, filled in
+# with str.format_map
+_DELETION_TEMPLATE = """================================================================================
+DELETED ENDPOINT: {method_upper} {path}
+================================================================================
+
+⚠️  API ENDPOINT REMOVED
+
+This endpoint has been removed from the API and is no longer available.
+
+Endpoint: {method_upper} {path}
+Status: DELETED
+Date Removed: {date_removed}
+
+Please refer to the API documentation for alternative endpoints or contact 
+the API maintainers for migration guidance.
+
+================================================================================"""
+
+# Fixed-shape blocks of a curl file, filled in with str.format. Each is
+# yielded as a single multi-line piece of the newline-joined content.
+_CURL_HEADER_TEMPLATE = ("=" * 80 + "\n"
+                         "ENDPOINT: {method_upper} {path}\n"
+                         + "=" * 80 + "\n"
+                         "Summary: {summary}\n"
+                         "Description: {description}")
+
+_PARAMETER_DOC_TEMPLATE = """• {name} ({required_text})
+  Description: {description}
+  Type: {type}
+  Example: {example}
+"""
+
+_ADVANCED_EXAMPLES_TEMPLATE = """
+
+ADVANCED USAGE EXAMPLES:
+----------------------------------------
+# With verbose output and response headers:
+{verbose_command}
+
+# Save response to file:
+{curl_command} \\
+  -o response_output.json
+
+# With timing information:
+{curl_command} \\
+  -w "Total time: %{{time_total}}s"
+"""
 
 
 def parse_text_diff(file_path: str) -> Dict[str, List[Dict[str, str]]]:
     """Parse the text format API diff file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
         result = {
             'added': [],
             'deleted': [],
@@ -25,49 +170,46 @@ def parse_text_diff(file_path: str) -> Dict[str, List[Dict[str, str]]]:
         }
         
         current_section = None
-        lines = content.split('\n')
         
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines and separators
-            if not line or line.startswith('---'):
-                continue
-            
-            # Detect sections
-            if line.startswith('### New Endpoints:'):
-                current_section = 'added'
-                continue
-            elif line.startswith('### Deleted Endpoints:'):
-                current_section = 'deleted'
-                continue
-            elif line.startswith('### Modified Endpoints:'):
-                current_section = 'modified'
-                continue
-            
-            # Parse endpoint lines
-            if current_section and line and not line.startswith('-'):
-                # Parse "METHOD /path/" format
-                parts = line.split(' ', 1)
-                if len(parts) == 2:
-                    method = parts[0].strip()
-                    path = parts[1].strip()
-                    
-                    endpoint = {
-                        'method': method,
-                        'path': path
-                    }
-                    
-                    if current_section == 'modified':
-                        endpoint['modifications'] = []
-                    
-                    result[current_section].append(endpoint)
-            
-            # Parse modification details
-            elif current_section == 'modified' and line.startswith('-'):
-                if result[current_section]:
-                    # Add modification details to the last endpoint
-                    result[current_section][-1]['modifications'].append(line)
+        # Iterate the file lazily rather than reading and splitting it whole
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                
+                # Skip empty lines and separators
+                if not line or line.startswith('---'):
+                    continue
+                
+                # Detect sections (a heading only counts with its colon)
+                heading, colon, _ = line.partition(':')
+                section = _DIFF_SECTIONS.get(heading) if colon else None
+                if section:
+                    current_section = section
+                    continue
+                
+                # Parse endpoint lines
+                if current_section and line and not line.startswith('-'):
+                    # Parse "METHOD /path/" format
+                    method, separator, path = line.partition(' ')
+                    if separator:
+                        method = method.strip()
+                        path = path.strip()
+                        
+                        endpoint = {
+                            'method': method,
+                            'path': path
+                        }
+                        
+                        if current_section == 'modified':
+                            endpoint['modifications'] = []
+                        
+                        result[current_section].append(endpoint)
+                
+                # Parse modification details
+                elif current_section == 'modified' and line.startswith('-'):
+                    if result[current_section]:
+                        # Add modification details to the last endpoint
+                        result[current_section][-1]['modifications'].append(line)
         
         return result
     
@@ -79,11 +221,38 @@ def parse_text_diff(file_path: str) -> Dict[str, List[Dict[str, str]]]:
         return {'added': [], 'deleted': [], 'modified': []}
 
 
+def _build_ref_index(openapi_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Index every mapping under components/definitions by its '#/...' JSON pointer."""
+    ref_index = openapi_spec.setdefault('__ref_index__', {})
+    seen = set()
+    
+    def walk(node: Dict[str, Any], pointer: str):
+        # YAML aliases can make the same mapping reachable more than once
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        ref_index[pointer] = node
+        for key, value in node.items():
+            if isinstance(value, dict):
+                walk(value, f"{pointer}/{str(key).replace('~', '~0').replace('/', '~1')}")
+    
+    for root in ('components', 'definitions'):
+        if isinstance(openapi_spec.get(root), dict):
+            walk(openapi_spec[root], f"#/{root}")
+    
+    return ref_index
+
+
 def load_openapi_spec(file_path: str) -> Dict[Any, Any]:
     """Load and parse OpenAPI YAML specification."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+        # Hand the loader raw bytes; libyaml decodes UTF-8 itself, which is
+        # cheaper than going through a Python text wrapper
+        with open(file_path, 'rb') as file:
+            openapi_spec = yaml.load(file, Loader=_YAML_LOADER)
+        if isinstance(openapi_spec, dict):
+            _build_ref_index(openapi_spec)
+        return openapi_spec
     except FileNotFoundError:
         print(f"Error: OpenAPI file '{file_path}' not found.")
         return {}
@@ -97,17 +266,31 @@ def resolve_schema_ref(openapi_spec: Dict[str, Any], schema: Dict[str, Any]) ->
     if not isinstance(schema, dict):
         return schema
     
+    return _resolve_schema_ref(openapi_spec, schema)
+
+
+def _resolve_schema_ref(openapi_spec: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    """resolve_schema_ref for callers that already know schema is a dict."""
     if '$ref' in schema:
         ref_path = schema['$ref']
         if ref_path.startswith('#/'):
+            # Component refs are indexed when the spec is loaded; anything else
+            # is resolved once below and memoized in the same index
+            ref_index = openapi_spec.setdefault('__ref_index__', {})
+            if ref_path in ref_index:
+                return ref_index[ref_path]
+
             # Remove the '#/' prefix and split the path
-            path_parts = ref_path[2:].split('/')
-            
+            path_parts = _REF_PARTS_CACHE.get(ref_path)
+            if path_parts is None:
+                path_parts = _REF_PARTS_CACHE[ref_path] = tuple(ref_path[2:].split('/'))
+
             # Navigate through the OpenAPI spec to find the referenced schema
             current = openapi_spec
             try:
                 for part in path_parts:
                     current = current[part]
+                ref_index[ref_path] = current
                 return current
             except (KeyError, TypeError):
                 print(f"Warning: Could not resolve reference {ref_path}")
@@ -116,12 +299,30 @@ def resolve_schema_ref(openapi_spec: Dict[str, Any], schema: Dict[str, Any]) ->
     return schema
 
 
-def get_parameter_info(openapi_spec: Dict[str, Any], path: str, method: str) -> Dict[str, List[Dict]]:
+def _extract_endpoint(openapi_spec: Dict[str, Any], path: str, method: str,
+                      method_lower: Optional[str] = None) -> Dict[str, Any]:
+    """Resolve the path item and operation of an endpoint once for all get_*_info helpers."""
+    path_item = openapi_spec.get('paths', {}).get(path, {})
+    operation = path_item.get(method_lower or method.lower(), {}) if isinstance(path_item, dict) else {}
+    
+    if not isinstance(path_item, dict) or not isinstance(operation, dict):
+        print(f"Warning: Malformed path item for {method} {path}, skipping its details")
+        path_item, operation = {}, {}
+    
+    return {
+        'method': method,
+        'path': path,
+        'path_item': path_item,
+        'operation': operation
+    }
+
+
+def get_parameter_info(openapi_spec: Dict[str, Any], endpoint: Dict[str, Any]) -> Dict[str, List[Dict]]:
     """Extract comprehensive parameter information."""
     try:
-        path_item = openapi_spec.get('paths', {}).get(path, {})
-        operation = path_item.get(method.lower(), {})
-        parameters = operation.get('parameters', []) + path_item.get('parameters', [])
+        path_item = endpoint['path_item']
+        operation = endpoint['operation']
+        parameters = chain(operation.get('parameters', ()), path_item.get('parameters', ()))
         
         param_info = {
             'path': [],
@@ -144,16 +345,14 @@ def get_parameter_info(openapi_spec: Dict[str, Any], path: str, method: str) ->
         
         return param_info
     except Exception as e:
-        print(f"Warning: Could not extract parameter info for {method} {path}: {e}")
+        print(f"Warning: Could not extract parameter info for {endpoint['method']} {endpoint['path']}: {e}")
         return {'path': [], 'query': [], 'header': [], 'cookie': []}
 
 
-def get_request_body_info(openapi_spec: Dict[str, Any], path: str, method: str) -> Optional[Dict]:
+def get_request_body_info(openapi_spec: Dict[str, Any], endpoint: Dict[str, Any]) -> Optional[Dict]:
     """Get detailed request body information."""
     try:
-        path_item = openapi_spec.get('paths', {}).get(path, {})
-        operation = path_item.get(method.lower(), {})
-        request_body = operation.get('requestBody', {})
+        request_body = endpoint['operation'].get('requestBody', {})
         
         if not request_body:
             return None
@@ -179,16 +378,14 @@ def get_request_body_info(openapi_spec: Dict[str, Any], path: str, method: str)
         
         return body_info
     except Exception as e:
-        print(f"Warning: Could not get request body info for {method} {path}: {e}")
+        print(f"Warning: Could not get request body info for {endpoint['method']} {endpoint['path']}: {e}")
         return None
 
 
-def get_response_info(openapi_spec: Dict[str, Any], path: str, method: str) -> Dict[str, Dict]:
+def get_response_info(openapi_spec: Dict[str, Any], endpoint: Dict[str, Any]) -> Dict[str, Dict]:
     """Get detailed response information for all status codes."""
     try:
-        path_item = openapi_spec.get('paths', {}).get(path, {})
-        operation = path_item.get(method.lower(), {})
-        responses = operation.get('responses', {})
+        responses = endpoint['operation'].get('responses', {})
         
         response_info = {}
         
@@ -214,24 +411,143 @@ def get_response_info(openapi_spec: Dict[str, Any], path: str, method: str) -> D
         
         return response_info
     except Exception as e:
-        print(f"Warning: Could not get response info for {method} {path}: {e}")
+        print(f"Warning: Could not get response info for {endpoint['method']} {endpoint['path']}: {e}")
         return {}
 
 
-def get_realistic_example_value(schema: Dict[str, Any], field_name: str = "", openapi_spec: Dict[str, Any] = None) -> Any:
+def _dumps_compact(obj: Any) -> str:
+    """Serialize an example as compact JSON."""
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """Serialize an example as JSON indented by two spaces."""
+    return json.dumps(obj, indent=2)
+
+
+def _match_field_example(field_lower: str, rules: Tuple) -> Any:
+    """Return the example of the first rule whose keyword occurs in the field name."""
+    for keyword, example in rules:
+        if keyword in field_lower:
+            if isinstance(example, tuple):
+                return _match_field_example(field_lower, example)
+            return example
+    return None
+
+
+def _example_string(schema: Dict[str, Any], field_name: str, openapi_spec: Dict[str, Any],
+                    visited_refs: frozenset, depth: int) -> Any:
+    """Example for a string schema from its format, then from the field name."""
+    field_lower = field_name.lower()
+    
+    # Format-based examples
+    schema_format = schema.get('format')
+    if schema_format in _STRING_FORMAT_EXAMPLES:
+        return _STRING_FORMAT_EXAMPLES[schema_format]
+    elif 'url' in field_lower:
+        return "https://example.com/resource"
+    elif schema_format == 'binary':
+        return "@/path/to/file"
+    
+    # Field name-based examples
+    example = _match_field_example(field_lower, _STRING_FIELD_EXAMPLES)
+    return example if example is not None else "sample_string_value"
+
+
+def _example_integer(schema: Dict[str, Any], field_name: str, openapi_spec: Dict[str, Any],
+                     visited_refs: frozenset, depth: int) -> Any:
+    """Example for an integer schema from the field name."""
+    example = _match_field_example(field_name.lower(), _INTEGER_FIELD_EXAMPLES)
+    return example if example is not None else 42
+
+
+def _example_number(schema: Dict[str, Any], field_name: str, openapi_spec: Dict[str, Any],
+                    visited_refs: frozenset, depth: int) -> Any:
+    """Example for a number schema from the field name."""
+    example = _match_field_example(field_name.lower(), _NUMBER_FIELD_EXAMPLES)
+    return example if example is not None else 3.14
+
+
+def _example_boolean(schema: Dict[str, Any], field_name: str, openapi_spec: Dict[str, Any],
+                     visited_refs: frozenset, depth: int) -> Any:
+    """Example for a boolean schema from the field name."""
+    example = _match_field_example(field_name.lower(), _BOOLEAN_FIELD_EXAMPLES)
+    return example if example is not None else True
+
+
+def _example_array(schema: Dict[str, Any], field_name: str, openapi_spec: Dict[str, Any],
+                   visited_refs: frozenset, depth: int) -> Any:
+    """Example for an array schema: a single example item, or empty."""
+    item_schema = schema.get('items', {})
+    example_item = get_realistic_example_value(item_schema, field_name + "_item", openapi_spec, visited_refs, depth + 1)
+    return [example_item] if example_item is not None else []
+
+
+def _example_object(schema: Dict[str, Any], field_name: str, openapi_spec: Dict[str, Any],
+                    visited_refs: frozenset, depth: int) -> Any:
+    """Example for an object schema with one entry per declared property."""
+    obj = {}
+    properties = schema.get('properties', {})
+    for prop_name, prop_schema in properties.items():
+        obj[prop_name] = get_realistic_example_value(prop_schema, prop_name, openapi_spec, visited_refs, depth + 1)
+    return obj
+
+
+_EXAMPLE_TYPE_HANDLERS = {
+    'string': _example_string,
+    'integer': _example_integer,
+    'number': _example_number,
+    'boolean': _example_boolean,
+    'array': _example_array,
+    'object': _example_object
+}
+
+
+def get_realistic_example_value(schema: Dict[str, Any], field_name: str = "", openapi_spec: Dict[str, Any] = None,
+                                visited_refs: frozenset = frozenset(), depth: int = 0) -> Any:
     """Generate realistic example values based on OpenAPI schema and field names."""
     if not isinstance(schema, dict):
         return None
     
-    # Resolve schema references
+    return _realistic_example_value(schema, field_name, openapi_spec, visited_refs, depth)
+
+
+def _realistic_example_value(schema: Dict[str, Any], field_name: str, openapi_spec: Dict[str, Any],
+                             visited_refs: frozenset, depth: int) -> Any:
+    """get_realistic_example_value for callers that already know schema is a dict."""
+    if depth > _MAX_SCHEMA_DEPTH:
+        print(f"Warning: Example for {field_name or 'schema'} truncated at nesting depth {_MAX_SCHEMA_DEPTH}")
+        return None
+    
+    # Resolve schema references. visited_refs holds the refs resolved on the
+    # path from the root to this schema, so only a ref that leads back into
+    # itself is cut; refs that fail to resolve are never recorded
     if openapi_spec:
         if '$ref' in schema:
-            schema = resolve_schema_ref(openapi_spec, schema)
+            ref_path = schema['$ref']
+            if ref_path in visited_refs:
+                return None
+            resolved = _resolve_schema_ref(openapi_spec, schema)
+            if resolved is not schema:
+                visited_refs = visited_refs | {ref_path}
+            schema = resolved
         elif 'allOf' in schema:
             merged_schema = {}
+            merged_refs = set()
             for sub_schema in schema['allOf']:
-                resolved = resolve_schema_ref(openapi_spec, sub_schema) if '$ref' in sub_schema else sub_schema
+                if '$ref' in sub_schema:
+                    # Compare with this schema's ancestors only, so the same
+                    # ref repeated among siblings is merged each time
+                    if sub_schema['$ref'] in visited_refs:
+                        continue
+                    resolved = resolve_schema_ref(openapi_spec, sub_schema)
+                    if resolved is not sub_schema:
+                        merged_refs.add(sub_schema['$ref'])
+                else:
+                    resolved = sub_schema
                 merged_schema.update(resolved)
+            if merged_refs:
+                visited_refs = visited_refs | merged_refs
             schema = merged_schema
     
     # Check for explicit example
@@ -242,113 +558,42 @@ def get_realistic_example_value(schema: Dict[str, Any], field_name: str = "", op
     if 'enum' in schema and schema['enum']:
         return schema['enum'][0]
     
-    # Generate based on type and field name
+    # Generate based on type; only scalar handlers look at the field name
     schema_type = schema.get('type', 'string')
-    field_lower = field_name.lower()
-    
-    if schema_type == 'string':
-        # Format-based examples
-        if schema.get('format') == 'email':
-            return "john.doe@example.com"
-        elif schema.get('format') == 'date':
-            return "2024-01-15"
-        elif schema.get('format') == 'date-time':
-            return "2024-01-15T10:30:00Z"
-        elif schema.get('format') == 'uuid':
-            return "550e8400-e29b-41d4-a716-446655440000"
-        elif schema.get('format') == 'uri' or 'url' in field_lower:
-            return "https://example.com/resource"
-        elif schema.get('format') == 'binary':
-            return "@/path/to/file"
-        
-        # Field name-based examples
-        if 'email' in field_lower:
-            return "john.doe@example.com"
-        elif 'name' in field_lower:
-            if 'first' in field_lower:
-                return "John"
-            elif 'last' in field_lower:
-                return "Doe"
-            elif 'file' in field_lower:
-                return "@/path/to/video.mp4"
-            else:
-                return "Daily Diary Entry"
-        elif 'title' in field_lower:
-            return "Today's Activities"
-        elif 'description' in field_lower:
-            return "Students worked on math problems and participated in group discussions"
-        elif 'phone' in field_lower:
-            return "+1-234-567-8900"
-        elif 'address' in field_lower:
-            return "123 Main St, City, State 12345"
-        elif 'id' in field_lower or field_lower.endswith('_id'):
-            return "123"
-        elif 'status' in field_lower:
-            return "active"
-        elif 'type' in field_lower:
-            return "standard"
-        elif 'date' in field_lower:
-            return "2024-01-15"
-        elif 'time' in field_lower:
-            return "10:30:00"
-        elif 'file' in field_lower or 'video' in field_lower or 'image' in field_lower:
-            return "@/path/to/file"
-        
-        return "sample_string_value"
-        
-    elif schema_type == 'integer':
-        if 'id' in field_lower:
-            return 123
-        elif 'count' in field_lower or 'total' in field_lower:
-            return 25
-        elif 'score' in field_lower:
-            return 85
-        elif 'age' in field_lower:
-            return 28
-        return 42
-        
-    elif schema_type == 'number':
-        if 'price' in field_lower or 'cost' in field_lower:
-            return 29.99
-        elif 'rate' in field_lower:
-            return 4.5
-        elif 'percentage' in field_lower:
-            return 75.5
-        return 3.14
-        
-    elif schema_type == 'boolean':
-        if 'active' in field_lower or 'enabled' in field_lower:
-            return True
-        elif 'deleted' in field_lower or 'disabled' in field_lower:
-            return False
-        return True
-        
-    elif schema_type == 'array':
-        item_schema = schema.get('items', {})
-        example_item = get_realistic_example_value(item_schema, field_name + "_item", openapi_spec)
-        return [example_item] if example_item is not None else []
-        
-    elif schema_type == 'object':
-        obj = {}
-        properties = schema.get('properties', {})
-        for prop_name, prop_schema in properties.items():
-            obj[prop_name] = get_realistic_example_value(prop_schema, prop_name, openapi_spec)
-        return obj
-    
-    return None
+    handler = _EXAMPLE_TYPE_HANDLERS.get(schema_type) if isinstance(schema_type, str) else None
+    if handler is None:
+        return None
+    return handler(schema, field_name, openapi_spec, visited_refs, depth)
 
 
-def get_schema_structure(schema: Dict[str, Any], indent: int = 0, openapi_spec: Dict[str, Any] = None) -> List[str]:
+def get_schema_structure(schema: Dict[str, Any], indent: int = 0, openapi_spec: Dict[str, Any] = None,
+                         visited_refs: frozenset = frozenset(), depth: int = 0) -> List[str]:
     """Generate detailed schema structure with field types and names."""
+    if not isinstance(schema, dict):
+        return [f"{'  ' * indent}unknown_type"]
+    
+    return _schema_structure(schema, indent, openapi_spec, visited_refs, depth)
+
+
+def _schema_structure(schema: Dict[str, Any], indent: int, openapi_spec: Dict[str, Any],
+                      visited_refs: frozenset, depth: int) -> List[str]:
+    """get_schema_structure for callers that already know schema is a dict."""
     lines = []
     indent_str = "  " * indent
     
-    if not isinstance(schema, dict):
-        return [f"{indent_str}unknown_type"]
+    if depth > _MAX_SCHEMA_DEPTH:
+        return [f"{indent_str}... (truncated at nesting depth {_MAX_SCHEMA_DEPTH})"]
     
     # Resolve schema references
     if openapi_spec:
-        schema = resolve_schema_ref(openapi_spec, schema)
+        if '$ref' in schema:
+            ref_path = schema['$ref']
+            if ref_path in visited_refs:
+                return [f"{indent_str}(circular reference: {ref_path})"]
+            resolved = _resolve_schema_ref(openapi_spec, schema)
+            if resolved is not schema:
+                visited_refs = visited_refs | {ref_path}
+            schema = resolved
     
     schema_type = schema.get('type', 'unknown')
     
@@ -367,13 +612,13 @@ def get_schema_structure(schema: Dict[str, Any], indent: int = 0, openapi_spec:
             # Handle different field types
             if field_type == 'object':
                 lines.append(f"{indent_str}{field_name}: object{required_marker}")
-                lines.extend(get_schema_structure(field_schema, indent + 1, openapi_spec))
+                lines.extend(_schema_structure(field_schema, indent + 1, openapi_spec, visited_refs, depth + 1))
             elif field_type == 'array':
                 items_schema = field_schema.get('items', {})
                 items_type = items_schema.get('type', 'unknown')
                 if items_type == 'object':
                     lines.append(f"{indent_str}{field_name}: array of objects{required_marker}")
-                    lines.extend(get_schema_structure(items_schema, indent + 1, openapi_spec))
+                    lines.extend(_schema_structure(items_schema, indent + 1, openapi_spec, visited_refs, depth + 1))
                 else:
                     lines.append(f"{indent_str}{field_name}: array of {items_type}{required_marker}")
             else:
@@ -392,7 +637,7 @@ def get_schema_structure(schema: Dict[str, Any], indent: int = 0, openapi_spec:
         items_type = items_schema.get('type', 'unknown')
         if items_type == 'object':
             lines.append(f"{indent_str}array of objects:")
-            lines.extend(get_schema_structure(items_schema, indent + 1, openapi_spec))
+            lines.extend(_schema_structure(items_schema, indent + 1, openapi_spec, visited_refs, depth + 1))
         else:
             lines.append(f"{indent_str}array of {items_type}")
     
@@ -406,28 +651,17 @@ def get_schema_structure(schema: Dict[str, Any], indent: int = 0, openapi_spec:
     return lines
 
 
-def get_operation_info(openapi_spec: Dict[str, Any], path: str, method: str) -> Dict:
+def get_operation_info(endpoint: Dict[str, Any]) -> Dict:
     """Get operation-level information like summary, description, tags."""
-    try:
-        path_item = openapi_spec.get('paths', {}).get(path, {})
-        operation = path_item.get(method.lower(), {})
-        
-        return {
-            'summary': operation.get('summary', 'No summary available'),
-            'description': operation.get('description', 'No description available'),
-            'tags': operation.get('tags', []),
-            'operationId': operation.get('operationId', ''),
-            'deprecated': operation.get('deprecated', False)
-        }
-    except Exception as e:
-        print(f"Warning: Could not get operation info for {method} {path}: {e}")
-        return {
-            'summary': 'No summary available',
-            'description': 'No description available',
-            'tags': [],
-            'operationId': '',
-            'deprecated': False
-        }
+    operation = endpoint['operation']
+    
+    return {
+        'summary': operation.get('summary', 'No summary available'),
+        'description': operation.get('description', 'No description available'),
+        'tags': operation.get('tags', []),
+        'operationId': operation.get('operationId', ''),
+        'deprecated': operation.get('deprecated', False)
+    }
 
 
 def resolve_path_with_examples(path: str, param_info: Dict) -> Tuple[str, str]:
@@ -455,7 +689,7 @@ def generate_multipart_form_example(schema: Dict[str, Any], openapi_spec: Dict[s
     
     # Resolve schema references
     if openapi_spec:
-        schema = resolve_schema_ref(openapi_spec, schema)
+        schema = _resolve_schema_ref(openapi_spec, schema)
     
     properties = schema.get('properties', {})
     
@@ -463,8 +697,8 @@ def generate_multipart_form_example(schema: Dict[str, Any], openapi_spec: Dict[s
         field_type = field_schema.get('type', 'string')
         field_format = field_schema.get('format', '')
         
-        # Generate example value
-        example_value = get_realistic_example_value(field_schema, field_name, openapi_spec)
+        # Generate example value (field_schema is known to be a mapping here)
+        example_value = _realistic_example_value(field_schema, field_name, openapi_spec, frozenset(), 0)
         
         if field_format == 'binary' or 'file' in field_name.lower():
             # File upload field
@@ -477,148 +711,123 @@ def generate_multipart_form_example(schema: Dict[str, Any], openapi_spec: Dict[s
     return form_parts
 
 
-def generate_comprehensive_curl_content(openapi_spec: Dict[str, Any], path: str, method: str, base_url: str = "https://api.example.com") -> str:
-    """Generate comprehensive curl file content with full API context."""
+def _iter_curl_content_lines(openapi_spec: Dict[str, Any], path: str, method: str, base_url: str,
+                             method_lower: Optional[str] = None) -> Iterator[str]:
+    """Yield the lines of a comprehensive curl file one at a time."""
     
     # Get all information
-    operation_info = get_operation_info(openapi_spec, path, method)
-    param_info = get_parameter_info(openapi_spec, path, method)
-    request_body_info = get_request_body_info(openapi_spec, path, method)
-    response_info = get_response_info(openapi_spec, path, method)
+    endpoint = _extract_endpoint(openapi_spec, path, method, method_lower)
+    operation_info = get_operation_info(endpoint)
+    param_info = get_parameter_info(openapi_spec, endpoint)
+    request_body_info = get_request_body_info(openapi_spec, endpoint)
+    response_info = get_response_info(openapi_spec, endpoint)
+    
+    method_upper = method.upper()
+    has_body = method_upper in ('POST', 'PUT', 'PATCH')
     
     # Resolve path parameters
     resolved_path, path_param_docs = resolve_path_with_examples(path, param_info)
     full_url = f"{base_url.rstrip('/')}{resolved_path}"
     
-    content_lines = []
-    
     # Header with endpoint information
-    content_lines.extend([
-        "=" * 80,
-        f"ENDPOINT: {method.upper()} {path}",
-        "=" * 80,
-        f"Summary: {operation_info['summary']}",
-        f"Description: {operation_info['description']}",
-    ])
+    yield _CURL_HEADER_TEMPLATE.format(method_upper=method_upper, path=path,
+                                       summary=operation_info['summary'],
+                                       description=operation_info['description'])
     
     if operation_info['tags']:
-        content_lines.append(f"Tags: {', '.join(operation_info['tags'])}")
+        yield f"Tags: {', '.join(operation_info['tags'])}"
     
     if operation_info['deprecated']:
-        content_lines.append("⚠️  DEPRECATED: This endpoint is deprecated")
-    
-    content_lines.append("")
-    
-    # Path Parameters Documentation
-    if param_info['path']:
-        content_lines.extend([
-            "PATH PARAMETERS:",
-            "-" * 40
-        ])
-        for param in param_info['path']:
-            required_text = "REQUIRED" if param['required'] else "optional"
-            content_lines.extend([
-                f"• {param['name']} ({required_text})",
-                f"  Description: {param['description']}",
-                f"  Type: {param['schema'].get('type', 'unknown')}",
-                f"  Example: {param['example']}",
-                ""
-            ])
-    
-    # Query Parameters Documentation
-    if param_info['query']:
-        content_lines.extend([
-            "QUERY PARAMETERS:",
-            "-" * 40
-        ])
-        for param in param_info['query']:
-            required_text = "REQUIRED" if param['required'] else "optional"
-            content_lines.extend([
-                f"• {param['name']} ({required_text})",
-                f"  Description: {param['description']}",
-                f"  Type: {param['schema'].get('type', 'unknown')}",
-                f"  Example: {param['example']}",
-                ""
-            ])
+        yield "⚠️  DEPRECATED: This endpoint is deprecated"
+    
+    yield ""
+    
+    # Path and Query Parameters Documentation
+    for location, heading in (('path', "PATH PARAMETERS:"), ('query', "QUERY PARAMETERS:")):
+        if not param_info[location]:
+            continue
+        yield heading
+        yield "-" * 40
+        for param in param_info[location]:
+            yield _PARAMETER_DOC_TEMPLATE.format(
+                name=param['name'],
+                required_text="REQUIRED" if param['required'] else "optional",
+                description=param['description'],
+                type=param['schema'].get('type', 'unknown'),
+                example=param['example']
+            )
     
     # Request Body Documentation
-    if request_body_info and method.upper() in ['POST', 'PUT', 'PATCH']:
-        content_lines.extend([
-            "REQUEST BODY:",
-            "-" * 40,
-            f"Description: {request_body_info['description']}",
-            f"Required: {'Yes' if request_body_info['required'] else 'No'}",
-            ""
-        ])
+    if request_body_info and has_body:
+        yield "REQUEST BODY:"
+        yield "-" * 40
+        yield f"Description: {request_body_info['description']}"
+        yield f"Required: {'Yes' if request_body_info['required'] else 'No'}"
+        yield ""
         
         for content_type, content_data in request_body_info['content_types'].items():
             schema = content_data.get('schema', {})
             
-            content_lines.extend([
-                f"Content-Type: {content_type}",
-                "Field Structure:",
-            ])
+            yield f"Content-Type: {content_type}"
+            yield "Field Structure:"
             
             # Add detailed schema structure
-            schema_lines = get_schema_structure(schema, openapi_spec=openapi_spec)
-            content_lines.extend(schema_lines)
+            yield from get_schema_structure(schema, openapi_spec=openapi_spec)
             
-            content_lines.extend([
-                "",
-                "Example JSON:",
-                json.dumps(content_data['example'], indent=2) if content_data['example'] else "No example available",
-                ""
-            ])
+            yield ""
+            yield "Example JSON:"
+            yield _dumps_pretty(content_data['example']) if content_data['example'] else "No example available"
+            yield ""
     
     # Response Documentation
     if response_info:
-        content_lines.extend([
-            "RESPONSES:",
-            "-" * 40
-        ])
+        yield "RESPONSES:"
+        yield "-" * 40
         
         for status_code, response_data in response_info.items():
-            content_lines.extend([
-                f"Status {status_code}: {response_data['description']}",
-                ""
-            ])
+            yield f"Status {status_code}: {response_data['description']}"
+            yield ""
             
             for content_type, content_data in response_data['content'].items():
                 schema = content_data.get('schema', {})
                 
-                content_lines.extend([
-                    f"  Content-Type: {content_type}",
-                    f"  Response Structure:",
-                ])
+                yield f"  Content-Type: {content_type}"
+                yield "  Response Structure:"
                 
                 # Add detailed schema structure with indentation
-                schema_lines = get_schema_structure(schema, indent=1, openapi_spec=openapi_spec)
-                content_lines.extend(schema_lines)
+                yield from get_schema_structure(schema, indent=1, openapi_spec=openapi_spec)
                 
-                content_lines.extend([
-                    f"  Example Response:",
-                    "  " + json.dumps(content_data['example'], indent=2).replace('\n', '\n  ') if content_data['example'] else "  No example available",
-                    ""
-                ])
+                yield "  Example Response:"
+                if content_data['example']:
+                    yield textwrap.indent(_dumps_pretty(content_data['example']), '  ')
+                else:
+                    yield "  No example available"
+                yield ""
     
     # Determine primary content type for the curl command
     primary_content_type = "application/json"  # Default
     is_multipart = False
     
+    # Compact request-body examples are shared by the basic command and the
+    # content-type specific examples, so serialize each one only once
+    compact_examples = {}
+    
     if request_body_info:
         content_types = list(request_body_info['content_types'].keys())
         if content_types:
             primary_content_type = content_types[0]
             is_multipart = 'multipart/form-data' in primary_content_type
+        
+        for content_type, content_data in request_body_info['content_types'].items():
+            if content_data['example']:
+                compact_examples[content_type] = _dumps_compact(content_data['example'])
     
     # Basic curl command
-    content_lines.extend([
-        "BASIC CURL COMMAND:",
-        "-" * 40
-    ])
+    yield "BASIC CURL COMMAND:"
+    yield "-" * 40
     
     curl_parts = [
-        f"curl -X {method.upper()}",
+        f"curl -X {method_upper}",
         f'"{full_url}"'
     ]
     
@@ -638,7 +847,7 @@ def generate_comprehensive_curl_content(openapi_spec: Dict[str, Any], path: str,
             curl_parts[1] = f'"{full_url}"'
     
     # Handle request body based on content type
-    if request_body_info and method.upper() in ['POST', 'PUT', 'PATCH']:
+    if request_body_info and has_body:
         if is_multipart:
             # For multipart/form-data, don't set Content-Type header (curl will set it automatically with boundary)
             schema = request_body_info['content_types'][primary_content_type].get('schema', {})
@@ -647,59 +856,33 @@ def generate_comprehensive_curl_content(openapi_spec: Dict[str, Any], path: str,
         else:
             # For JSON or other content types
             curl_parts.append(f'-H "Content-Type: {primary_content_type}"')
-            json_content = request_body_info['content_types'].get(primary_content_type)
-            if json_content and json_content['example']:
-                body_json = json.dumps(json_content['example'], separators=(',', ':'))
+            body_json = compact_examples.get(primary_content_type)
+            if body_json:
                 curl_parts.append(f"-d '{body_json}'")
-    elif not request_body_info and method.upper() in ['POST', 'PUT', 'PATCH']:
+    elif not request_body_info and has_body:
         # Default content type for methods that typically have bodies
         curl_parts.append(f'-H "Content-Type: {primary_content_type}"')
     
     curl_command = " \\\n  ".join(curl_parts)
-    content_lines.append(curl_command)
-    
-    # Advanced curl examples
-    content_lines.extend([
-        "",
-        "",
-        "ADVANCED USAGE EXAMPLES:",
-        "-" * 40
-    ])
-    
-    # With verbose output
-    content_lines.extend([
-        "# With verbose output and response headers:",
-        curl_command.replace("curl -X", "curl -v -X"),
-        ""
-    ])
-    
-    # Save response to file
-    content_lines.extend([
-        "# Save response to file:",
-        curl_command + " \\\n  -o response_output.json",
-        ""
-    ])
-    
-    # With timing information
-    content_lines.extend([
-        "# With timing information:",
-        curl_command + " \\\n  -w \"Total time: %{time_total}s\"",
-        ""
-    ])
+    yield curl_command
+    
+    # Advanced curl examples: verbose output, saving to a file and timing
+    yield _ADVANCED_EXAMPLES_TEMPLATE.format(
+        curl_command=curl_command,
+        verbose_command=curl_command.replace("curl -X", "curl -v -X")
+    )
     
     # Content-type specific examples
     if request_body_info:
-        content_lines.extend([
-            "CONTENT-TYPE SPECIFIC EXAMPLES:",
-            "-" * 40
-        ])
+        yield "CONTENT-TYPE SPECIFIC EXAMPLES:"
+        yield "-" * 40
         
         for content_type, content_data in request_body_info['content_types'].items():
-            content_lines.append(f"# For {content_type}:")
+            yield f"# For {content_type}:"
             
             if 'multipart/form-data' in content_type:
                 multipart_curl = [
-                    f"curl -X {method.upper()}",
+                    f"curl -X {method_upper}",
                     f'"{full_url}"',
                     '-H "Authorization: Bearer YOUR_TOKEN_HERE"'
                 ]
@@ -708,35 +891,35 @@ def generate_comprehensive_curl_content(openapi_spec: Dict[str, Any], path: str,
                 form_parts = generate_multipart_form_example(schema, openapi_spec)
                 multipart_curl.extend(form_parts)
                 
-                content_lines.append(" \\\n  ".join(multipart_curl))
+                yield " \\\n  ".join(multipart_curl)
             else:
                 json_curl = [
-                    f"curl -X {method.upper()}",
+                    f"curl -X {method_upper}",
                     f'"{full_url}"',
                     f'-H "Content-Type: {content_type}"',
                     '-H "Authorization: Bearer YOUR_TOKEN_HERE"'
                 ]
                 
-                if content_data['example']:
-                    body_json = json.dumps(content_data['example'], separators=(',', ':'))
-                    json_curl.append(f"-d '{body_json}'")
+                if content_type in compact_examples:
+                    json_curl.append(f"-d '{compact_examples[content_type]}'")
                 
-                content_lines.append(" \\\n  ".join(json_curl))
+                yield " \\\n  ".join(json_curl)
             
-            content_lines.extend(["", ""])
-    
-    return '\n'.join(content_lines)
+            yield ""
+            yield ""
+
 
+def generate_comprehensive_curl_content(openapi_spec: Dict[str, Any], path: str, method: str, base_url: str = "https://api.example.com",
+                                        method_lower: Optional[str] = None) -> str:
+    """Generate comprehensive curl file content with full API context."""
+    return '\n'.join(_iter_curl_content_lines(openapi_spec, path, method, base_url, method_lower))
 
+
+@lru_cache(maxsize=None)
 def sanitize_filename(method: str, path: str) -> str:
     """Convert method and path to a safe filename."""
-    clean_path = re.sub(r'^/', '', path)
-    clean_path = re.sub(r'[/{}\[\]<>:"|?*]', '_', clean_path)
-    clean_path = re.sub(r'_+', '_', clean_path)
-    clean_path = clean_path.strip('_')
-    
-    if not clean_path:
-        clean_path = "root"
+    clean_path = path.lstrip('/').translate(_UNSAFE_FILENAME_TABLE)
+    clean_path = _UNDERSCORE_RUNS.sub('_', clean_path).strip('_') or "root"
     
     return f"{method.upper()}__{clean_path}.txt"
 
@@ -744,22 +927,127 @@ def sanitize_filename(method: str, path: str) -> str:
 def generate_all_endpoints_from_openapi(openapi_spec: Dict[str, Any]) -> List[Dict[str, str]]:
     """Extract all endpoints from OpenAPI specification."""
     endpoints = []
+    append = endpoints.append
     
     paths = openapi_spec.get('paths', {})
     for path, path_item in paths.items():
-        methods = ['get', 'post', 'put', 'patch', 'delete', 'head', 'options', 'trace']
+        if not isinstance(path_item, dict):
+            print(f"Warning: Malformed path item for {path}, skipping it")
+            continue
+        
+        # Intersect with the verb set instead of probing every verb; sort by
+        # rank so the endpoint order does not depend on set iteration order
+        methods = _HTTP_METHOD_SET.intersection(path_item.keys())
         
-        for method in methods:
-            if method in path_item:
-                endpoints.append({
-                    'method': method.upper(),
-                    'path': path
-                })
+        for method in sorted(methods, key=_HTTP_METHOD_RANK.__getitem__):
+            append({
+                'method': method.upper(),
+                'method_lower': method,
+                'path': path
+            })
     
     return endpoints
 
 
-def create_enhanced_curl_files(openapi_file: str, api_diff_file: str, output_dir: str = "curl_files"):
+# Flags for creating, or truncating, a generated file
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+
+def _write_file(filepath: Path, data: bytes):
+    """Write bytes to a file with a bare open/write/close, skipping the buffered IO layers."""
+    fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Below this many endpoints rendering stays in this process; starting the
+# pool and handing it the spec costs more than it saves
+_PARALLEL_RENDER_MIN_ENDPOINTS = 256
+
+# Spec and base URL shared by pool workers, set once per process by
+# _init_render_worker
+_worker_spec: Dict[str, Any] = {}
+_worker_base_url = "https://api.example.com"
+
+
+def _init_render_worker(openapi_spec: Dict[str, Any], base_url: str):
+    """Store the spec in the worker so it is pickled once per process, not per task."""
+    global _worker_spec, _worker_base_url
+    _worker_spec = openapi_spec
+    _worker_base_url = base_url
+
+
+def _render_endpoint(openapi_spec: Dict[str, Any], base_url: str, endpoint: Dict[str, str]) -> bytes:
+    """Render the encoded curl file content of a single endpoint."""
+    content = generate_comprehensive_curl_content(openapi_spec, endpoint['path'], endpoint['method'],
+                                                  base_url, endpoint.get('method_lower'))
+    return content.encode('utf-8')
+
+
+def _render_worker_endpoint(endpoint: Dict[str, str]) -> bytes:
+    """Render an endpoint in a pool worker against the spec stored by _init_render_worker."""
+    return _render_endpoint(_worker_spec, _worker_base_url, endpoint)
+
+
+def _write_endpoint_files(out_dir: Path, endpoints: List[Dict[str, str]], rendered: Iterator[bytes],
+                          verbose: bool):
+    """Write rendered curl files in endpoint order, so the last of any colliding names wins."""
+    for endpoint, data in zip(endpoints, rendered):
+        method = endpoint['method']
+        path = endpoint['path']
+        if verbose:
+            print(f"Processing endpoint: {method} {path}")
+        
+        filepath = out_dir / sanitize_filename(method, path)
+        _write_file(filepath, data)
+        
+        if verbose:
+            print(f"Created: {filepath}")
+
+
+def _iter_summary_section(title: str, endpoints: Optional[List[Dict[str, str]]]) -> Iterator[str]:
+    """Yield the lines of one titled list of diff endpoints, if there are any."""
+    if not endpoints:
+        return
+    yield title
+    yield '-' * 20
+    for endpoint in endpoints:
+        yield f"  {endpoint['method']} {endpoint['path']}"
+    yield ""
+
+
+def _iter_summary_lines(all_endpoints: List[Dict[str, str]], method_groups: Dict[str, List[str]],
+                        diff_data: Dict[str, List[Dict[str, str]]], deleted_count: int,
+                        base_url: str) -> Iterator[str]:
+    """Yield the lines of summary.txt, without line terminators."""
+    yield "API ENDPOINTS SUMMARY"
+    yield "=" * 50
+    yield f"Total active endpoints: {len(all_endpoints)}"
+    yield f"Added endpoints: {len(diff_data.get('added', []))}"
+    yield f"Modified endpoints: {len(diff_data.get('modified', []))}"
+    yield f"Deleted endpoints: {deleted_count}"
+    yield f"Base URL: {base_url}"
+    yield ""
+    yield "Endpoints by method:"
+    
+    for method, paths in sorted(method_groups.items()):
+        yield f"  {method}: {len(paths)} endpoints"
+        for path in paths:
+            yield f"    - {path}"
+        yield ""
+    
+    # Diff sections, in this order, skipping empty ones
+    yield from _iter_summary_section("DELETED ENDPOINTS:", diff_data.get('deleted'))
+    yield from _iter_summary_section("ADDED ENDPOINTS:", diff_data.get('added'))
+    yield from _iter_summary_section("MODIFIED ENDPOINTS:", diff_data.get('modified'))
+
+
+def create_enhanced_curl_files(openapi_file: str, api_diff_file: str, output_dir: str = "curl_files",
+                               verbose: bool = False):
     """Main function to create comprehensive curl files."""
     
     # Load OpenAPI specification
@@ -773,8 +1061,23 @@ def create_enhanced_curl_files(openapi_file: str, api_diff_file: str, output_dir
     print("Parsing API diff...")
     diff_data = parse_text_diff(api_diff_file)
     
-    # Create output directory
-    Path(output_dir).mkdir(exist_ok=True)
+    # Fill in the defaults of deleted entries once, so the notice loop below
+    # can index them directly and pass them straight to _DELETION_TEMPLATE
+    deleted_endpoints = []
+    for endpoint in diff_data.get('deleted', []):
+        method = endpoint.get('method', 'GET')
+        deleted_endpoints.append({
+            'method': method,
+            'method_upper': method.upper(),
+            'path': endpoint.get('path', '/'),
+            'date_removed': endpoint.get('date_removed', 'Unknown')
+        })
+    
+    # Create output directory. Everything written below is reproducible from
+    # the spec and diff, so files are deliberately never flushed or fsynced
+    # (nor is the directory); durability would only slow bulk output down.
+    out_dir = Path(output_dir)
+    os.makedirs(out_dir, exist_ok=True)
     
     # Get base URL from OpenAPI spec
     base_url = "https://api.example.com"
@@ -787,119 +1090,60 @@ def create_enhanced_curl_files(openapi_file: str, api_diff_file: str, output_dir
     print("Generating comprehensive curl files for all endpoints...")
     all_endpoints = generate_all_endpoints_from_openapi(openapi_spec)
     
-    for endpoint in all_endpoints:
-        method = endpoint['method']
-        path = endpoint['path']
-        
-        print(f"Processing endpoint: {method} {path}")
-        
-        filename = sanitize_filename(method, path)
-        filepath = Path(output_dir) / filename
-        
-        comprehensive_content = generate_comprehensive_curl_content(
-            openapi_spec, path, method, base_url
-        )
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(comprehensive_content)
-        
-        print(f"Created: {filepath}")
+    # Rendering is CPU-bound and independent per endpoint, so large specs are
+    # spread over worker processes. Files are written here, in endpoint order,
+    # so endpoints whose names sanitize to the same file (e.g. /users/{id} and
+    # /users/id) always leave the last one on disk.
+    if len(all_endpoints) < _PARALLEL_RENDER_MIN_ENDPOINTS:
+        rendered = map(partial(_render_endpoint, openapi_spec, base_url), all_endpoints)
+        _write_endpoint_files(out_dir, all_endpoints, rendered, verbose)
+    else:
+        workers = min(os.cpu_count() or 1, len(all_endpoints))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(openapi_spec, base_url)) as executor:
+            rendered = executor.map(_render_worker_endpoint, all_endpoints, chunksize=32)
+            _write_endpoint_files(out_dir, all_endpoints, rendered, verbose)
     
     # Process deleted endpoints - create simple deletion notice files
     print(f"\nProcessing deleted endpoints...")
-    for endpoint in diff_data.get('deleted', []):
-        method = endpoint.get('method', 'GET')
-        path = endpoint.get('path', '/')
+    for endpoint in deleted_endpoints:
+        method = endpoint['method']
+        path = endpoint['path']
         
-        print(f"Marking as deleted: {method} {path}")
+        if verbose:
+            print(f"Marking as deleted: {method} {path}")
         
         filename = sanitize_filename(method, path)
-        filepath = Path(output_dir) / filename
+        filepath = out_dir / filename
         
-        deletion_content = f"""================================================================================
-DELETED ENDPOINT: {method.upper()} {path}
-================================================================================
-
-⚠️  API ENDPOINT REMOVED
-
-This endpoint has been removed from the API and is no longer available.
-
-Endpoint: {method.upper()} {path}
-Status: DELETED
-Date Removed: {endpoint.get('date_removed', 'Unknown')}
-
-Please refer to the API documentation for alternative endpoints or contact 
-the API maintainers for migration guidance.
-
-================================================================================"""
+        deletion_content = _DELETION_TEMPLATE.format_map(endpoint)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(deletion_content)
+        _write_file(filepath, deletion_content.encode('utf-8'))
         
-        print(f"Marked as deleted: {filepath}")
+        if verbose:
+            print(f"Marked as deleted: {filepath}")
     
     added_count = len(diff_data.get('added', []))
-    deleted_count = len(diff_data.get('deleted', []))
+    deleted_count = len(deleted_endpoints)
     modified_count = len(diff_data.get('modified', []))
-    summary_content = [
-        "API ENDPOINTS SUMMARY",
-        "=" * 50,
-        f"Total active endpoints: {len(all_endpoints)}",
-        f"Added endpoints: {added_count}",
-        f"Modified endpoints: {modified_count}",
-        f"Deleted endpoints: {deleted_count}",
-        f"Base URL: {base_url}",
-        "",
-        "Endpoints by method:",
-    ]
     
-    # Group by method
-    method_groups = {}
-    for endpoint in all_endpoints:
-        method = endpoint['method']
-        if method not in method_groups:
-            method_groups[method] = []
-        method_groups[method].append(endpoint['path'])
-    
-    for method, paths in sorted(method_groups.items()):
-        summary_content.extend([
-            f"  {method}: {len(paths)} endpoints",
-            *[f"    - {path}" for path in sorted(paths)],
-            ""
-        ])
-    
-    # Add deleted endpoints section
-    if diff_data.get('deleted'):
-        summary_content.extend([
-            "DELETED ENDPOINTS:",
-            "-" * 20
-        ])
-        for endpoint in diff_data['deleted']:
-            summary_content.append(f"  {endpoint['method']} {endpoint['path']}")
-        summary_content.append("")
-
-    if diff_data.get('added'):
-        summary_content.extend([
-            "ADDED ENDPOINTS:",
-            "-" * 20
-        ])
-        for endpoint in diff_data['added']:
-            summary_content.append(f"  {endpoint['method']} {endpoint['path']}")
-        summary_content.append("")
-
-    if diff_data.get('modified'):
-        summary_content.extend([
-            "MODIFIED ENDPOINTS:",
-            "-" * 20
-        ])
-        for endpoint in diff_data['modified']:
-            summary_content.append(f"  {endpoint['method']} {endpoint['path']}")
-        summary_content.append("")
-
-    # Write summary file
-    summary_file = Path(output_dir) / "summary.txt"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(summary_content))
+    # Group by method, keeping each group's paths sorted as they are inserted
+    method_groups = defaultdict(list)
+    for method, path in map(itemgetter('method', 'path'), all_endpoints):
+        bisect.insort(method_groups[method], path)
+    
+    # Stream the summary straight into a temporary file rather than building
+    # it in memory, then rename it into place so readers never see it half-written
+    summary_file = out_dir / "summary.txt"
+    summary_tmp = summary_file.with_suffix('.txt.tmp')
+    with open(summary_tmp, 'w', encoding='utf-8', newline='') as summary_fp:
+        # Lines are newline-separated, not terminated. Every section ends with
+        # a blank line, so the file ends with a single newline; only a summary
+        # with no endpoints or diff sections ends without one.
+        lines = _iter_summary_lines(all_endpoints, method_groups, diff_data, deleted_count, base_url)
+        summary_fp.write(next(lines))
+        summary_fp.writelines(map('\n'.__add__, lines))
+    os.replace(summary_tmp, summary_file)
     
     print(f"\n" + "="*50)
     print(f"Summary:")
@@ -920,7 +1164,8 @@ if __name__ == "__main__":
     parser.add_argument("api_diff_file", help="Path to API diff text file")
     parser.add_argument("-o", "--output", default="curl_files", help="Output directory (default: curl_files)")
     parser.add_argument("--base-url", help="Base URL for API calls (overrides OpenAPI servers)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print a line for every file written")
     
     args = parser.parse_args()
     
-    create_enhanced_curl_files(args.openapi_file, args.api_diff_file, args.output)
\ No newline at end of file
+    create_enhanced_curl_files(args.openapi_file, args.api_diff_file, args.output, args.verbose)
\ No newline at end of file
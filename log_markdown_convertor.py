@@ -4,16 +4,127 @@ API Endpoint Logs to Markdown Converter
 Converts API endpoint log files to a formatted Markdown documentation file.
 """
 
+import io
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
+# Patterns used by EndpointLogParser and MarkdownGenerator, compiled once at
+# import instead of being looked up in re's cache on every call
 
-class EndpointLogParser:
-    def __init__(self):
-        self.endpoint_data = {}
+# Single-line header fields; plain "Label: value" lines are read with
+# _line_after instead
+_ENDPOINT_RE = re.compile(r'ENDPOINT: (\w+) (.+)')
+_CONTENT_TYPE_RE = re.compile(r'Content-Type: (.+)')
+
+# Multi-line sections as (head pattern, markers that end the section). The
+# body starts after the head and runs up to the first of the markers found
+# anywhere after it, else to the end of the text.
+_DESCRIPTION_SECTION = (re.compile(r'Description: (?=.)', re.DOTALL),
+                        ('Tags:', 'PATH PARAMETERS:', 'QUERY PARAMETERS:', 'RESPONSES:'))
+_PATH_PARAMS_SECTION = (re.compile(r'PATH PARAMETERS:\s*-{40}\s*'),
+                        ('QUERY PARAMETERS:', 'RESPONSES:', 'BASIC CURL COMMAND:'))
+_QUERY_PARAMS_SECTION = (re.compile(r'QUERY PARAMETERS:\s*-{40}\s*'),
+                         ('REQUEST BODY:', 'RESPONSES:', 'BASIC CURL COMMAND:'))
+_REQUEST_BODY_SECTION = (re.compile(r'REQUEST BODY:\s*-{40}\s*'),
+                         ('RESPONSES:', 'BASIC CURL COMMAND:'))
+_RESPONSES_SECTION = (re.compile(r'RESPONSES:\s*-{40}\s*'),
+                      ('BASIC CURL COMMAND:',))
+_BASIC_CURL_SECTION = (re.compile(r'BASIC CURL COMMAND:\s*-{40}\s*'),
+                       ('ADVANCED USAGE EXAMPLES:',))
+# The advanced examples run to the end of the text
+_ADVANCED_CURL_HEAD_RE = re.compile(r'ADVANCED USAGE EXAMPLES:\s*-{40}\s*')
+
+# Splitters and in-section patterns
+_PARAM_BULLET_RE = re.compile(r'•\s+')
+_PARAM_FIELD_RE = re.compile(r'(Description|Type|Example):')
+_NEXT_CONTENT_TYPE_RE = re.compile(r'\nContent-Type:')
+_FIELD_TYPE_RE = re.compile(r'([^(]+)')
+_FIELD_FORMAT_RE = re.compile(r'\(format: ([^)]+)\)')
+_STATUS_SPLIT_RE = re.compile(r'Status (\d+):')
+_NEXT_SECTION_RE = re.compile(r'\n\n[A-Z]')
+_CURL_TITLE_SPLIT_RE = re.compile(r'# (.+):')
+_ANCHOR_STRIP_RE = re.compile(r'[^\w\s-]')
+
+# Header rows of the generated markdown tables
+_PARAMETERS_TABLE_HEADER = ("| Name | Type | Required | Description | Example |\n"
+                            "|------|------|----------|-------------|---------|")
+_FIELDS_TABLE_HEADER = ("| Field | Type | Format | Required | Description |\n"
+                        "|-------|------|--------|----------|-------------|")
+
+# Fixed-shape markdown blocks filled in with str.format_map, from the parsed
+# endpoint, request body or response dict
+_OVERVIEW_TEMPLATE = ("# {endpoint}\n\n## Overview\n\n| Property | Value |\n|----------|-------|\n"
+                      "| **Method** | `{method}` |\n| **Path** | `{path}` |")
+_ENDPOINT_SECTION_TEMPLATE = ("## {endpoint}\n| Property | Value |\n|----------|-------|\n"
+                              "| **Method** | `{method}` |\n| **Path** | `{path}` |")
+_TAGS_ROW_TEMPLATE = "\n| **Tags** | {tags} |"
+_SUMMARY_ROW_TEMPLATE = "\n| **Summary** | {summary} |"
+_REQUEST_BODY_HEADER_TEMPLATE = "### {content_type}\n\n| Property | Value |\n|----------|-------|"
+_REQUEST_BODY_DESCRIPTION_ROW_TEMPLATE = "\n| **Description** | {description} |"
+_RESPONSE_STATUS_TEMPLATE = "\n#### Status {status}"
+_RESPONSE_CONTENT_TYPE_TEMPLATE = "\n**Content-Type:** `{content_type}`"
+
+# Finds where an embedded JSON example ends using the C scanner
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _line_after(text: str, prefix: str) -> Optional[str]:
+    """Return what follows prefix on its line, for the first non-empty match (as prefix + '(.+)')."""
+    position = text.find(prefix)
+    while position != -1:
+        start = position + len(prefix)
+        end = text.find('\n', start)
+        if end == -1:
+            end = len(text)
+        if end > start:
+            return text[start:end]
+        position = text.find(prefix, position + 1)
+    return None
+
+
+def _extract_section(content: str, section: Tuple, min_length: int = 0) -> Optional[str]:
+    """Return the body of a section of a log, or None when its head does not occur."""
+    head_re, end_markers = section
+    head_match = head_re.search(content)
+    if not head_match:
+        return None
+    
+    start = head_match.end()
+    search_from = start + min_length
     
-    def parse_file(self, file_path: str) -> Dict:
+    # The end of the text, not counting one final newline (like regex '$')
+    end = len(content)
+    if end > search_from and content[end - 1] == '\n':
+        end -= 1
+    
+    # Plain str.find per marker, instead of trying every marker at every
+    # character as a lazy regex with a lookahead would
+    for marker in end_markers:
+        position = content.find(marker, search_from, end)
+        if position != -1:
+            end = position
+    
+    return content[start:end]
+
+
+def _iter_param_blocks(params_text: str) -> Iterator[str]:
+    """Yield the text around each '•' bullet one piece at a time, like re.split would list it."""
+    start = 0
+    for bullet in _PARAM_BULLET_RE.finditer(params_text):
+        yield params_text[start:bullet.start()]
+        start = bullet.end()
+    yield params_text[start:]
+
+
+class EndpointLogParser:
+    @staticmethod
+    def parse_file(file_path: str) -> Dict:
         """Parse a single endpoint log file and extract structured data."""
         with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
@@ -34,73 +145,74 @@ class EndpointLogParser:
         }
         
         # Extract endpoint information
-        endpoint_match = re.search(r'ENDPOINT: (\w+) (.+)', content)
+        endpoint_match = _ENDPOINT_RE.search(content)
         if endpoint_match:
             data['method'] = endpoint_match.group(1)
             data['path'] = endpoint_match.group(2)
             data['endpoint'] = f"{data['method']} {data['path']}"
         
         # Extract summary
-        summary_match = re.search(r'Summary: (.+)', content)
-        if summary_match:
-            data['summary'] = summary_match.group(1).strip()
+        summary = _line_after(content, 'Summary: ')
+        if summary is not None:
+            data['summary'] = summary.strip()
         
         # Extract description
-        desc_match = re.search(r'Description: (.+?)(?=Tags:|PATH PARAMETERS:|QUERY PARAMETERS:|RESPONSES:|$)', content, re.DOTALL)
-        if desc_match:
-            data['description'] = desc_match.group(1).strip()
+        description = _extract_section(content, _DESCRIPTION_SECTION, min_length=1)
+        if description is not None:
+            data['description'] = description.strip()
         
         # Extract tags
-        tags_match = re.search(r'Tags: (.+)', content)
-        if tags_match:
-            data['tags'] = tags_match.group(1).strip()
+        tags = _line_after(content, 'Tags: ')
+        if tags is not None:
+            data['tags'] = tags.strip()
         
         # Extract path parameters
-        path_params_section = re.search(r'PATH PARAMETERS:\s*-{40}\s*(.*?)(?=QUERY PARAMETERS:|RESPONSES:|BASIC CURL COMMAND:|$)', content, re.DOTALL)
-        if path_params_section:
-            data['path_parameters'] = self._parse_parameters(path_params_section.group(1))
+        path_params_section = _extract_section(content, _PATH_PARAMS_SECTION)
+        if path_params_section is not None:
+            data['path_parameters'] = EndpointLogParser._parse_parameters(path_params_section)
         
         # Extract query parameters
-        query_params_section = re.search(r'QUERY PARAMETERS:\s*-{40}\s*(.*?)(?=REQUEST BODY:|RESPONSES:|BASIC CURL COMMAND:|$)', content, re.DOTALL)
-        if query_params_section:
-            data['query_parameters'] = self._parse_parameters(query_params_section.group(1))
+        query_params_section = _extract_section(content, _QUERY_PARAMS_SECTION)
+        if query_params_section is not None:
+            data['query_parameters'] = EndpointLogParser._parse_parameters(query_params_section)
         
         # Extract request body
-        request_body_section = re.search(r'REQUEST BODY:\s*-{40}\s*(.*?)(?=RESPONSES:|BASIC CURL COMMAND:|$)', content, re.DOTALL)
-        if request_body_section:
-            data['request_body'] = self._parse_request_body(request_body_section.group(1))
+        request_body_section = _extract_section(content, _REQUEST_BODY_SECTION)
+        if request_body_section is not None:
+            data['request_body'] = EndpointLogParser._parse_request_body(request_body_section)
         
         # Extract responses
-        responses_section = re.search(r'RESPONSES:\s*-{40}\s*(.*?)(?=BASIC CURL COMMAND:|$)', content, re.DOTALL)
-        if responses_section:
-            data['responses'] = self._parse_responses(responses_section.group(1))
+        responses_section = _extract_section(content, _RESPONSES_SECTION)
+        if responses_section is not None:
+            data['responses'] = EndpointLogParser._parse_responses(responses_section)
         
         # Extract curl examples
-        curl_section = re.search(r'BASIC CURL COMMAND:\s*-{40}\s*(.*?)(?=ADVANCED USAGE EXAMPLES:|$)', content, re.DOTALL)
-        if curl_section:
+        curl_section = _extract_section(content, _BASIC_CURL_SECTION)
+        if curl_section is not None:
             data['curl_examples'].append({
                 'title': 'Basic Command',
-                'command': curl_section.group(1).strip()
+                'command': curl_section.strip()
             })
         
-        advanced_curl_section = re.search(r'ADVANCED USAGE EXAMPLES:\s*-{40}\s*(.*)', content, re.DOTALL)
-        if advanced_curl_section:
-            advanced_examples = self._parse_advanced_curl(advanced_curl_section.group(1))
+        advanced_curl_match = _ADVANCED_CURL_HEAD_RE.search(content)
+        if advanced_curl_match:
+            advanced_examples = EndpointLogParser._parse_advanced_curl(content[advanced_curl_match.end():])
             data['curl_examples'].extend(advanced_examples)
         
         return data
     
-    def _parse_parameters(self, params_text: str) -> List[Dict]:
+    @staticmethod
+    def _parse_parameters(params_text: str) -> List[Dict]:
         """Parse parameter sections."""
         parameters = []
-        param_blocks = re.split(r'•\s+', params_text)
         
-        for block in param_blocks:
-            if not block.strip():
+        for block in _iter_param_blocks(params_text):
+            block = block.strip()
+            if not block:
                 continue
             
             param = {}
-            lines = block.strip().split('\n')
+            lines = block.split('\n')
             
             # Extract parameter name and required status
             first_line = lines[0].strip()
@@ -120,21 +232,13 @@ class EndpointLogParser:
             for line in lines[1:]:
                 line_stripped = line.strip()
                 
-                if line_stripped.startswith('Description:'):
-                    if current_field:
-                        param[current_field] = '\n'.join(current_content).strip()
-                    current_field = 'description'
-                    current_content = [line_stripped.replace('Description:', '').strip()]
-                elif line_stripped.startswith('Type:'):
-                    if current_field:
-                        param[current_field] = '\n'.join(current_content).strip()
-                    current_field = 'type'
-                    current_content = [line_stripped.replace('Type:', '').strip()]
-                elif line_stripped.startswith('Example:'):
+                # A "Description:", "Type:" or "Example:" line starts a new field
+                field_match = _PARAM_FIELD_RE.match(line_stripped)
+                if field_match:
                     if current_field:
                         param[current_field] = '\n'.join(current_content).strip()
-                    current_field = 'example'
-                    current_content = [line_stripped.replace('Example:', '').strip()]
+                    current_field = field_match.group(1).lower()
+                    current_content = [line_stripped.replace(field_match.group(0), '').strip()]
                 elif current_field and line_stripped:
                     # Continue multi-line content
                     current_content.append(line_stripped)
@@ -143,23 +247,46 @@ class EndpointLogParser:
             if current_field:
                 param[current_field] = '\n'.join(current_content).strip()
             
+            # Multi-line descriptions are stored in their table-cell form
+            if '\n' in param.get('description', ''):
+                param['description'] = EndpointLogParser._format_multiline_description(param['description'])
+            
             parameters.append(param)
         
         return parameters
     
-    def _parse_request_body(self, request_body_text: str) -> List[Dict]:
+    @staticmethod
+    def _format_multiline_description(description: str) -> str:
+        """Join the lines of a description with <br>, turning '*' option lines into bullets."""
+        formatted_desc = []
+        
+        for line in description.split('\n'):
+            line = line.strip()
+            if line.startswith('*'):
+                # Format option lines like: * `1` - Bring To School
+                formatted_desc.append(f"<br>• {line[2:]}")  # Remove '* ' and add bullet
+            elif line:
+                if not formatted_desc:
+                    formatted_desc.append(line)
+                else:
+                    formatted_desc.append(f"<br>{line}")
+        
+        return ''.join(formatted_desc)
+    
+    @staticmethod
+    def _parse_request_body(request_body_text: str) -> List[Dict]:
         """Parse request body section with multiple content types."""
         request_bodies = []
         
         # Extract basic info first
-        description_match = re.search(r'Description: (.+)', request_body_text)
-        required_match = re.search(r'Required: (.+)', request_body_text)
+        description_line = _line_after(request_body_text, 'Description: ')
+        required_line = _line_after(request_body_text, 'Required: ')
         
-        base_description = description_match.group(1).strip() if description_match else ""
-        is_required = required_match.group(1).strip().lower() == 'yes' if required_match else False
+        base_description = description_line.strip() if description_line is not None else ""
+        is_required = required_line.strip().lower() == 'yes' if required_line is not None else False
         
         # Split by Content-Type sections
-        content_type_sections = re.split(r'Content-Type: (.+)', request_body_text)
+        content_type_sections = _CONTENT_TYPE_RE.split(request_body_text)
         
         # Process each content type section
         for i in range(1, len(content_type_sections), 2):
@@ -181,18 +308,18 @@ class EndpointLogParser:
                     if 'Example JSON:' in field_section:
                         field_section = field_section.split('Example JSON:')[0]
                     
-                    request_body['fields'] = self._parse_field_structure(field_section)
+                    request_body['fields'] = EndpointLogParser._parse_field_structure(field_section)
                 
                 # Extract example JSON
                 if 'Example JSON:' in section_content:
-                    json_example = self._extract_complete_json(section_content, 'Example JSON:')
+                    json_example = EndpointLogParser._extract_complete_json(section_content, 'Example JSON:')
                     if json_example:
                         request_body['example'] = json_example
                     else:
                         # Fallback extraction
                         example_section = section_content.split('Example JSON:')[1].strip()
                         # Take content until next Content-Type or end
-                        next_content_type = re.search(r'\nContent-Type:', example_section)
+                        next_content_type = _NEXT_CONTENT_TYPE_RE.search(example_section)
                         if next_content_type:
                             request_body['example'] = example_section[:next_content_type.start()].strip()
                         else:
@@ -202,14 +329,14 @@ class EndpointLogParser:
         
         return request_bodies
     
-    def _parse_field_structure(self, field_text: str) -> List[Dict]:
+    @staticmethod
+    def _parse_field_structure(field_text: str) -> List[Dict]:
         """Parse field structure from request body."""
         fields = []
-        lines = field_text.strip().split('\n')
-        
         current_field = None
         
-        for line in lines:
+        # Lines are stripped one by one below, so the text as a whole is not
+        for line in field_text.split('\n'):
             line = line.strip()
             if not line:
                 continue
@@ -236,7 +363,7 @@ class EndpointLogParser:
                 # Parse field info like "string (required)" or "string (format: uuid) (required)"
                 if field_info:
                     # Extract type
-                    type_match = re.match(r'([^(]+)', field_info)
+                    type_match = _FIELD_TYPE_RE.match(field_info)
                     if type_match:
                         current_field['type'] = type_match.group(1).strip()
                     
@@ -247,7 +374,7 @@ class EndpointLogParser:
                         current_field['required'] = False
                     
                     # Extract format
-                    format_match = re.search(r'\(format: ([^)]+)\)', field_info)
+                    format_match = _FIELD_FORMAT_RE.search(field_info)
                     if format_match:
                         current_field['format'] = format_match.group(1).strip()
             
@@ -264,7 +391,8 @@ class EndpointLogParser:
         
         return fields
     
-    def _extract_complete_json(self, text: str, start_marker: str) -> str:
+    @staticmethod
+    def _extract_complete_json(text: str, start_marker: str) -> str:
         """Extract complete JSON object with proper brace matching."""
         start_index = text.find(start_marker)
         if start_index == -1:
@@ -275,6 +403,13 @@ class EndpointLogParser:
         if json_start == -1:
             return ""
         
+        # Valid JSON ends where the decoder stops, which is the brace matching
+        # the opening one; anything else falls back to counting braces
+        try:
+            return text[json_start:_JSON_DECODER.raw_decode(text, json_start)[1]]
+        except (ValueError, RecursionError):
+            pass
+        
         # Count braces to find the complete JSON
         brace_count = 0
         json_end = json_start
@@ -308,12 +443,13 @@ class EndpointLogParser:
         
         return ""
     
-    def _parse_responses(self, responses_text: str) -> List[Dict]:
+    @staticmethod
+    def _parse_responses(responses_text: str) -> List[Dict]:
         """Parse response sections with improved JSON extraction."""
         responses = []
         
         # Split by status codes
-        status_blocks = re.split(r'Status (\d+):', responses_text)
+        status_blocks = _STATUS_SPLIT_RE.split(responses_text)
         
         for i in range(1, len(status_blocks), 2):
             if i + 1 < len(status_blocks):
@@ -333,20 +469,20 @@ class EndpointLogParser:
                     response['description'] = 'No response body'
                 else:
                     # Extract content type
-                    content_type_match = re.search(r'Content-Type: (.+)', content)
-                    if content_type_match:
-                        response['content_type'] = content_type_match.group(1).strip()
+                    content_type = _line_after(content, 'Content-Type: ')
+                    if content_type is not None:
+                        response['content_type'] = content_type.strip()
                     
                     # Extract example response with proper JSON handling
                     if 'Example Response:' in content:
-                        json_example = self._extract_complete_json(content, 'Example Response:')
+                        json_example = EndpointLogParser._extract_complete_json(content, 'Example Response:')
                         if json_example:
                             response['example'] = json_example
                         else:
                             # Fallback to simpler extraction if JSON parsing fails
                             example_section = content.split('Example Response:')[1].strip()
                             # Take everything until next major section or end
-                            next_section = re.search(r'\n\n[A-Z]', example_section)
+                            next_section = _NEXT_SECTION_RE.search(example_section)
                             if next_section:
                                 response['example'] = example_section[:next_section.start()].strip()
                             else:
@@ -363,12 +499,13 @@ class EndpointLogParser:
         
         return responses
     
-    def _parse_advanced_curl(self, curl_text: str) -> List[Dict]:
+    @staticmethod
+    def _parse_advanced_curl(curl_text: str) -> List[Dict]:
         """Parse advanced curl examples."""
         examples = []
         
         # Split by comments (lines starting with #)
-        sections = re.split(r'# (.+):', curl_text)
+        sections = _CURL_TITLE_SPLIT_RE.split(curl_text)
         
         for i in range(1, len(sections), 2):
             if i + 1 < len(sections):
@@ -384,291 +521,265 @@ class EndpointLogParser:
 
 
 class MarkdownGenerator:
-    def __init__(self):
-        pass
-    
-    def generate_single_endpoint_markdown(self, endpoint: Dict) -> str:
+    @staticmethod
+    def generate_single_endpoint_markdown(endpoint: Dict) -> str:
         """Generate markdown documentation for a single endpoint."""
-        sections = []
-        
-        # Add title
-        sections.append(f"# {endpoint['endpoint']}")
-        sections.append("")
-        
-        # Basic info table
-        info_table = []
-        info_table.append("## Overview")
-        info_table.append("")
-        info_table.append("| Property | Value |")
-        info_table.append("|----------|-------|")
-        info_table.append(f"| **Method** | `{endpoint['method']}` |")
-        info_table.append(f"| **Path** | `{endpoint['path']}` |")
+        out = io.StringIO()
+        MarkdownGenerator.write_single_endpoint_markdown(endpoint, out)
+        return out.getvalue()
+    
+    @staticmethod
+    def write_single_endpoint_markdown(endpoint: Dict, out_fp: TextIO) -> None:
+        """Write markdown documentation for a single endpoint to an open file."""
+        # Every piece after the title starts with its separating newline
+        w = out_fp.write
+        
+        # Title and basic info table
+        w(_OVERVIEW_TEMPLATE.format_map(endpoint))
         if endpoint['tags']:
-            info_table.append(f"| **Tags** | {endpoint['tags']} |")
+            w(_TAGS_ROW_TEMPLATE.format_map(endpoint))
         if endpoint['summary'] and endpoint['summary'] != 'No summary available':
-            info_table.append(f"| **Summary** | {endpoint['summary']} |")
-        
-        sections.extend(info_table)
-        sections.append("")
+            w(_SUMMARY_ROW_TEMPLATE.format_map(endpoint))
+        w("\n")
         
         # Description
         if endpoint['description']:
-            sections.append(f"## Description")
-            sections.append("")
-            sections.append(endpoint['description'])
-            sections.append("")
+            w(f"\n## Description\n\n{endpoint['description']}\n")
         
         # Path Parameters
         if endpoint['path_parameters']:
-            sections.append("## Path Parameters")
-            sections.append("")
-            sections.append(self._generate_parameters_table(endpoint['path_parameters']))
-            sections.append("")
+            w(f"\n## Path Parameters\n\n{MarkdownGenerator._generate_parameters_table(endpoint['path_parameters'])}\n")
         
         # Query Parameters
         if endpoint['query_parameters']:
-            sections.append("## Query Parameters")
-            sections.append("")
-            sections.append(self._generate_parameters_table(endpoint['query_parameters']))
-            sections.append("")
+            w(f"\n## Query Parameters\n\n{MarkdownGenerator._generate_parameters_table(endpoint['query_parameters'])}\n")
         
         # Request Body
         if endpoint['request_body']:
-            sections.append("## Request Body")
-            sections.append("")
+            w("\n## Request Body\n")
             for request_body in endpoint['request_body']:
-                sections.append(self._generate_request_body_section(request_body))
-                sections.append("")
+                w(f"\n{MarkdownGenerator._generate_request_body_section(request_body)}\n")
         
         # Responses
         if endpoint['responses']:
-            sections.append("## Responses")
-            sections.append("")
+            w("\n## Responses\n")
             for response in endpoint['responses']:
-                sections.append(self._generate_response_section(response))
-                sections.append("")
+                w(f"\n{MarkdownGenerator._generate_response_section(response)}\n")
         
         # cURL Examples
         if endpoint['curl_examples']:
-            sections.append("## cURL Examples")
-            sections.append("")
+            w("\n## cURL Examples\n")
             for example in endpoint['curl_examples']:
-                sections.append(f"### {example['title']}")
-                sections.append("")
-                sections.append(f"```bash\n{example['command']}\n```")
-                sections.append("")
-        
-        return '\n'.join(sections)
+                w(f"\n### {example['title']}\n\n```bash\n{example['command']}\n```\n")
     
-    def _generate_request_body_section(self, request_body: Dict) -> str:
+    @staticmethod
+    def _generate_request_body_section(request_body: Dict) -> str:
         """Generate markdown section for request body."""
-        sections = []
-        
-        # Content type header
-        sections.append(f"### {request_body['content_type']}")
-        sections.append("")
+        out = io.StringIO()
+        w = out.write
         
-        # Basic info
-        info_table = []
-        info_table.append("| Property | Value |")
-        info_table.append("|----------|-------|")
-        info_table.append(f"| **Required** | {'Yes' if request_body['required'] else 'No'} |")
+        # Content type header and basic info
+        w(_REQUEST_BODY_HEADER_TEMPLATE.format_map(request_body))
+        w("\n| **Required** | Yes |" if request_body['required'] else "\n| **Required** | No |")
         if request_body['description'] and request_body['description'] != 'No description available':
-            info_table.append(f"| **Description** | {request_body['description']} |")
-        
-        sections.extend(info_table)
-        sections.append("")
+            w(_REQUEST_BODY_DESCRIPTION_ROW_TEMPLATE.format_map(request_body))
+        w("\n")
         
         # Field structure
         if request_body['fields']:
-            sections.append("**Field Structure:**")
-            sections.append("")
-            sections.append(self._generate_request_body_fields_table(request_body['fields']))
-            sections.append("")
+            w(f"\n**Field Structure:**\n\n{MarkdownGenerator._generate_request_body_fields_table(request_body['fields'])}\n")
         
         # Example
         if request_body['example']:
-            sections.append("**Example:**")
-            sections.append("")
-            sections.append(f"```json\n{request_body['example']}\n```")
-            sections.append("")
+            w(f"\n**Example:**\n\n```json\n{request_body['example']}\n```\n")
         
-        return '\n'.join(sections)
+        return out.getvalue()
     
-    def _generate_request_body_fields_table(self, fields: List[Dict]) -> str:
+    @staticmethod
+    def _generate_request_body_fields_table(fields: List[Dict]) -> str:
         """Generate a markdown table for request body fields."""
         if not fields:
             return ""
         
-        table = []
-        table.append("| Field | Type | Format | Required | Description |")
-        table.append("|-------|------|--------|----------|-------------|")
-        
-        for field in fields:
-            name = field.get('name', '')
-            field_type = field.get('type', '')
-            field_format = field.get('format', '')
-            required = '✓' if field.get('required', False) else ''
-            description = field.get('description', '')
-            
-            # Handle special formatting for nested fields
-            if field_type.startswith('array of'):
-                field_type = f"`{field_type}`"
-            elif field_type == 'unknown':
-                field_type = 'object'
-            
-            table.append(f"| `{name}` | {field_type} | {field_format} | {required} | {description} |")
-        
-        return '\n'.join(table)
+        return '\n'.join(chain((_FIELDS_TABLE_HEADER,),
+                               map(MarkdownGenerator._generate_request_body_field_row, fields)))
     
-    def generate_markdown(self, endpoints_data: List[Dict]) -> str:
+    @staticmethod
+    def _generate_request_body_field_row(field: Dict) -> str:
+        """Generate one markdown table row for a request body field."""
+        field_type = field.get('type', '')
+        
+        # Handle special formatting for nested fields
+        if field_type.startswith('array of'):
+            field_type = f"`{field_type}`"
+        elif field_type == 'unknown':
+            field_type = 'object'
+        
+        return (f"| `{field.get('name', '')}` | {field_type} | {field.get('format', '')} | "
+                f"{'✓' if field.get('required', False) else ''} | {field.get('description', '')} |")
+    
+    @staticmethod
+    def generate_markdown(endpoints_data: List[Dict]) -> str:
         """Generate a complete Markdown documentation from parsed endpoint data."""
-        md_content = []
-        
+        return ''.join(MarkdownGenerator.iter_markdown(endpoints_data))
+    
+    @staticmethod
+    def iter_markdown(endpoints_data: List[Dict]) -> Iterator[str]:
+        """Yield the complete Markdown documentation piece by piece, e.g. for writelines()."""
         # Add title and table of contents
-        md_content.append("# API Documentation\n")
-        md_content.append("## Table of Contents\n")
+        yield "# API Documentation\n"
+        yield "\n## Table of Contents\n"
         
         for i, endpoint in enumerate(endpoints_data, 1):
-            anchor = self._create_anchor(endpoint['endpoint'])
-            md_content.append(f"{i}. [{endpoint['endpoint']}](#{anchor})")
+            anchor = MarkdownGenerator._create_anchor(endpoint['endpoint'])
+            yield f"\n{i}. [{endpoint['endpoint']}](#{anchor})"
         
-        md_content.append("\n---\n")
+        yield "\n\n---\n"
         
         # Generate documentation for each endpoint
         for endpoint in endpoints_data:
-            md_content.append(self._generate_endpoint_section(endpoint))
-        
-        return '\n'.join(md_content)
+            yield "\n"
+            yield MarkdownGenerator._generate_endpoint_section(endpoint)
     
-    def _create_anchor(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _create_anchor(text: str) -> str:
         """Create a markdown anchor from text."""
-        return re.sub(r'[^\w\s-]', '', text.lower()).replace(' ', '-')
+        return _ANCHOR_STRIP_RE.sub('', text.lower()).replace(' ', '-')
     
-    def _generate_endpoint_section(self, endpoint: Dict) -> str:
+    @staticmethod
+    def _generate_endpoint_section(endpoint: Dict) -> str:
         """Generate markdown section for a single endpoint."""
-        sections = []
-        
-        # Endpoint title
-        sections.append(f"## {endpoint['endpoint']}")
+        out = io.StringIO()
+        w = out.write
         
-        # Basic info table
-        info_table = []
-        info_table.append("| Property | Value |")
-        info_table.append("|----------|-------|")
-        info_table.append(f"| **Method** | `{endpoint['method']}` |")
-        info_table.append(f"| **Path** | `{endpoint['path']}` |")
+        # Endpoint title and basic info table
+        w(_ENDPOINT_SECTION_TEMPLATE.format_map(endpoint))
         if endpoint['tags']:
-            info_table.append(f"| **Tags** | {endpoint['tags']} |")
+            w(_TAGS_ROW_TEMPLATE.format_map(endpoint))
         if endpoint['summary'] and endpoint['summary'] != 'No summary available':
-            info_table.append(f"| **Summary** | {endpoint['summary']} |")
-        
-        sections.append('\n'.join(info_table))
+            w(_SUMMARY_ROW_TEMPLATE.format_map(endpoint))
         
         # Description
         if endpoint['description']:
-            sections.append(f"\n### Description\n{endpoint['description']}")
+            w(f"\n\n### Description\n{endpoint['description']}")
         
         # Path Parameters
         if endpoint['path_parameters']:
-            sections.append("\n### Path Parameters")
-            sections.append(self._generate_parameters_table(endpoint['path_parameters']))
+            w(f"\n\n### Path Parameters\n{MarkdownGenerator._generate_parameters_table(endpoint['path_parameters'])}")
         
         # Query Parameters
         if endpoint['query_parameters']:
-            sections.append("\n### Query Parameters")
-            sections.append(self._generate_parameters_table(endpoint['query_parameters']))
+            w(f"\n\n### Query Parameters\n{MarkdownGenerator._generate_parameters_table(endpoint['query_parameters'])}")
         
         # Responses
         if endpoint['responses']:
-            sections.append("\n### Responses")
+            w("\n\n### Responses")
             for response in endpoint['responses']:
-                sections.append(self._generate_response_section(response))
+                w(f"\n{MarkdownGenerator._generate_response_section(response)}")
         
         # cURL Examples
         if endpoint['curl_examples']:
-            sections.append("\n### cURL Examples")
+            w("\n\n### cURL Examples")
             for example in endpoint['curl_examples']:
-                sections.append(f"\n#### {example['title']}")
-                sections.append(f"```bash\n{example['command']}\n```")
+                w(f"\n\n#### {example['title']}\n```bash\n{example['command']}\n```")
         
-        sections.append("\n---\n")
+        w("\n\n---\n")
         
-        return '\n'.join(sections)
+        return out.getvalue()
     
-    def _generate_parameters_table(self, parameters: List[Dict]) -> str:
+    @staticmethod
+    def _generate_parameters_table(parameters: List[Dict]) -> str:
         """Generate a markdown table for parameters."""
         if not parameters:
             return ""
         
-        table = []
-        table.append("| Name | Type | Required | Description | Example |")
-        table.append("|------|------|----------|-------------|---------|")
-        
-        for param in parameters:
-            name = param.get('name', '')
-            param_type = param.get('type', '')
-            required = '✓' if param.get('required', False) else ''
-            description = param.get('description', 'No description available')
-            example = param.get('example', '')
-            
-            # Handle multi-line descriptions with option lists
-            if description and '\n' in description:
-                # Convert multi-line descriptions to proper markdown format
-                desc_lines = description.split('\n')
-                formatted_desc = []
-                
-                for line in desc_lines:
-                    line = line.strip()
-                    if line.startswith('* `') and '` -' in line:
-                        # Format option lines like: * `1` - Bring To School
-                        formatted_desc.append(f"<br>• {line[2:]}")  # Remove '* ' and add bullet
-                    elif line.startswith('*'):
-                        formatted_desc.append(f"<br>• {line[2:]}")  # Remove '* ' and add bullet
-                    elif line:
-                        if not formatted_desc:
-                            formatted_desc.append(line)
-                        else:
-                            formatted_desc.append(f"<br>{line}")
-                
-                description = ''.join(formatted_desc)
-            
-            # Escape pipe characters in table cells
-            description = description.replace('|', '\\|')
-            example = str(example).replace('|', '\\|')
-            
-            table.append(f"| `{name}` | {param_type} | {required} | {description} | {example} |")
-        
-        return '\n'.join(table)
+        return '\n'.join(chain((_PARAMETERS_TABLE_HEADER,),
+                               map(MarkdownGenerator._generate_parameter_row, parameters)))
+    
+    @staticmethod
+    def _generate_parameter_row(param: Dict) -> str:
+        """Generate one markdown table row for a parameter."""
+        name = param.get('name', '')
+        param_type = param.get('type', '')
+        required = '✓' if param.get('required', False) else ''
+        description = param.get('description', 'No description available')
+        example = param.get('example', '')
+        
+        # Escape pipe characters in table cells
+        description = description.replace('|', '\\|')
+        example = str(example).replace('|', '\\|')
+        
+        return f"| `{name}` | {param_type} | {required} | {description} | {example} |"
     
-    def _generate_response_section(self, response: Dict) -> str:
+    @staticmethod
+    def _generate_response_section(response: Dict) -> str:
         """Generate markdown section for a response."""
-        sections = []
+        out = io.StringIO()
+        w = out.write
         
-        sections.append(f"\n#### Status {response['status']}")
+        w(_RESPONSE_STATUS_TEMPLATE.format_map(response))
         
         if response['description']:
-            sections.append(response['description'])
+            w(f"\n{response['description']}")
         
         if response['content_type']:
-            sections.append(f"**Content-Type:** `{response['content_type']}`")
+            w(_RESPONSE_CONTENT_TYPE_TEMPLATE.format_map(response))
         
         if response['schema']:
-            sections.append("**Response Schema:**")
-            sections.append(f"```\n{response['schema']}\n```")
+            w(f"\n**Response Schema:**\n```\n{response['schema']}\n```")
         
         if response['example']:
-            sections.append("**Example Response:**")
-            sections.append(f"```json\n{response['example']}\n```")
+            w(f"\n**Example Response:**\n```json\n{response['example']}\n```")
         
-        return '\n'.join(sections)
+        return out.getvalue()
+
+
+# Below this many log files conversion stays in this process; starting worker
+# processes costs more than parsing a few files
+_PARALLEL_CONVERT_MIN_FILES = 64
+
+
+def _convert_log_file(file_path: Path, output_path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """Convert one log file to markdown, returning (output filename, None) or (None, error)."""
+    try:
+        # Parse the individual file
+        endpoint_data = EndpointLogParser.parse_file(str(file_path))
+        
+        # Create output filename (replace .txt with .md)
+        output_filename = file_path.stem + '.md'
+        output_file_path = output_path / output_filename
+        
+        # Stream the single endpoint's markdown straight into its file
+        with open(output_file_path, 'w', encoding='utf-8') as f:
+            MarkdownGenerator.write_single_endpoint_markdown(endpoint_data, f)
+        
+        return output_file_path.name, None
+    
+    except Exception as e:
+        return None, str(e)
+
+
+def _report_conversions(txt_files: List[Path],
+                        results: Iterator[Tuple[Optional[str], Optional[str]]]) -> Tuple[int, int]:
+    """Print the outcome of each conversion in file order, returning (processed, failed) counts."""
+    processed_count = 0
+    failed_count = 0
+    
+    for file_path, (output_name, error) in zip(txt_files, results):
+        print(f"Processing: {file_path.name}")
+        if error is None:
+            print(f"  → Generated: {output_name}")
+            processed_count += 1
+        else:
+            print(f"  ✗ Error processing {file_path.name}: {error}")
+            failed_count += 1
+    
+    return processed_count, failed_count
 
 
 def convert_logs_to_markdown(input_directory: str, output_directory: str = None):
     """Main function to convert all endpoint log files to separate markdown files."""
-    parser = EndpointLogParser()
-    generator = MarkdownGenerator()
-    
     # Use input directory as output directory if not specified
     if output_directory is None:
         output_directory = input_directory
@@ -687,33 +798,16 @@ def convert_logs_to_markdown(input_directory: str, output_directory: str = None)
     # Create output directory if it doesn't exist
     output_path.mkdir(parents=True, exist_ok=True)
     
-    processed_count = 0
-    failed_count = 0
-    
-    # Process each file separately
-    for file_path in txt_files:
-        print(f"Processing: {file_path.name}")
-        try:
-            # Parse the individual file
-            endpoint_data = parser.parse_file(str(file_path))
-            
-            # Generate markdown for single endpoint
-            markdown_content = generator.generate_single_endpoint_markdown(endpoint_data)
-            
-            # Create output filename (replace .txt with .md)
-            output_filename = file_path.stem + '.md'
-            output_file_path = output_path / output_filename
-            
-            # Write to individual markdown file
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            print(f"  → Generated: {output_file_path.name}")
-            processed_count += 1
-            
-        except Exception as e:
-            print(f"  ✗ Error processing {file_path.name}: {e}")
-            failed_count += 1
+    # Files are independent, so larger batches are converted in worker
+    # processes; results come back in file order and are reported here
+    if len(txt_files) < _PARALLEL_CONVERT_MIN_FILES:
+        results = map(_convert_log_file, txt_files, repeat(output_path))
+        processed_count, failed_count = _report_conversions(txt_files, results)
+    else:
+        workers = min(os.cpu_count() or 1, len(txt_files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_convert_log_file, txt_files, repeat(output_path), chunksize=16)
+            processed_count, failed_count = _report_conversions(txt_files, results)
     
     print(f"\n✓ Conversion completed!")
     print(f"  • Processed: {processed_count} files")
@@ -9,16 +9,113 @@ Supports various customization options for professional documentation.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
 
+# Patterns compiled once at import rather than looked up per call
 
-@dataclass
+# Filename conversion. This is not the generator's sanitize_filename: it
+# replaces every non-word character, including '-' and '.', which the
+# generator keeps, so links to paths containing them do not match the files
+_UNDERSCORE_RUNS_RE = re.compile(r'_+')
+
+# Summary text parsing (lines are stripped first, so no leading \s*)
+_DIGITS_RE = re.compile(r'\d+')
+_METHOD_COUNT_RE = re.compile(r'(\w+):\s*(\d+)\s*endpoints?')
+_CHANGE_LINE_RE = re.compile(r'(GET|POST|PUT|DELETE|PATCH)\s+/')
+_METHOD_ENDPOINT_RE = re.compile(r'^(GET|POST|PUT|DELETE|PATCH)\s+(.+)$')
+
+# Methods _CHANGE_LINE_RE accepts, for a startswith pre-check before the regex
+_HTTP_VERBS = ('GET', 'POST', 'PUT', 'DELETE', 'PATCH')
+
+# Summary count lines, keyed by the label before their colon
+_COUNT_FIELDS = {
+    "Total active endpoints": "total_endpoints",
+    "Added endpoints": "added_endpoints_count",
+    "Modified endpoints": "modified_endpoints_count",
+    "Deleted endpoints": "deleted_endpoints_count",
+}
+
+# Method sections follow common REST order; other methods come after, alphabetically
+_METHOD_ORDER = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')
+_METHOD_RANK = {method: rank for rank, method in enumerate(_METHOD_ORDER)}
+
+_METHOD_EMOJI = {
+    'GET': '📖', 'POST': '➕', 'PUT': '📝',
+    'PATCH': '🔧', 'DELETE': '❌'
+}
+
+# Write buffer for the output file; a few large writes instead of many small ones
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Footer timestamp layout
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+# HTTP methods distribution table: fixed heading, and one row per method
+_DISTRIBUTION_TABLE_HEADER = (
+    "### HTTP Methods Distribution\n\n"
+    "| Method | Count | Percentage |\n"
+    "|--------|-------|------------|\n"
+)
+_DISTRIBUTION_ROW_TEMPLATE = "| `%s` | %d | %.1f%% |\n"
+
+# Recent changes subsections: report field, heading, and text when empty
+_CHANGE_SUBSECTIONS = (
+    ("added_endpoints", "### ✅ Added Endpoints\n\n", "_No endpoints added_\n\n"),
+    ("modified_endpoints", "### 🔄 Modified Endpoints\n\n", "_No endpoints modified_\n\n"),
+    ("deleted_endpoints", "### ❌ Deleted Endpoints\n\n", "_No endpoints deleted_\n\n"),
+)
+
+# One row of per-method statistics: (method, endpoints, count, percentage, emoji)
+_MethodStat = Tuple[str, Tuple[str, ...], int, float, str]
+
+# Change list headers and the section each one opens
+_CHANGE_SECTION_HEADERS = {
+    "DELETED ENDPOINTS": "deleted",
+    "ADDED ENDPOINTS": "added",
+    "MODIFIED ENDPOINTS": "modified",
+}
+
+
+class _FilenameCharTable(dict):
+    """str.translate table mapping every non-word character to '_', filled in on first use."""
+    
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        # Same set as regex \w: alphanumerics and '_'
+        self[code] = replacement = char if char.isalnum() or char == '_' else '_'
+        return replacement
+
+
+_FILENAME_CHAR_TABLE = _FilenameCharTable()
+
+
+def _text_digest(text: str) -> bytes:
+    """Short content hash of a summary text, used as a cache key."""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _parse_count(text: str) -> int:
+    """Return the first run of digits in text as an int."""
+    value = text.strip()
+    if value.isdecimal():
+        return int(value)
+    # Anything beyond a bare number keeps the original first-digit-run rule
+    return int(_DIGITS_RE.search(text).group())
+
+
+# slots=True needs Python 3.10+, which is the minimum supported version for
+# this script; the action runs it on 3.11 (see action.yml)
+@dataclass(slots=True)
 class EndpointInfo:
     """Data class to store endpoint information"""
     method: str
@@ -26,7 +123,7 @@ class EndpointInfo:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class APIReport:
     """Data class to store complete API report information"""
     total_endpoints: int
@@ -34,15 +131,37 @@ class APIReport:
     modified_endpoints_count: int
     deleted_endpoints_count: int
     base_url: str
-    endpoints_by_method: Dict[str, List[str]]
-    deleted_endpoints: List[str]
-    added_endpoints: List[str]
-    modified_endpoints: List[str]
+    endpoints_by_method: Dict[str, Tuple[str, ...]]
+    deleted_endpoints: Tuple[str, ...]
+    added_endpoints: Tuple[str, ...]
+    modified_endpoints: Tuple[str, ...]
+    
+    method_totals: Dict[str, int] = field(init=False)
+    grand_total: int = field(init=False)
+    
+    def __post_init__(self):
+        """Precompute per-method and overall endpoint totals"""
+        self.method_totals = {method: len(endpoints) for method, endpoints in self.endpoints_by_method.items()}
+        self.grand_total = sum(self.method_totals.values())
+    
+    def copy(self) -> "APIReport":
+        """Copy with its own dicts; the endpoint tuples are immutable and shared"""
+        return replace(self, endpoints_by_method=dict(self.endpoints_by_method))
 
 
 class APIBeautifier:
     """Professional API documentation beautifier"""
     
+    # Parsed reports shared across instances, keyed by a hash of the raw text
+    # and whether the endpoint lists were sorted
+    _parse_cache: "OrderedDict[Tuple[bytes, bool], APIReport]" = OrderedDict()
+    _PARSE_CACHE_SIZE = 32
+    
+    # Finished documents, keyed by a hash of the raw text and every setting
+    # that affects the output
+    _render_cache: "OrderedDict[Tuple[bytes, tuple], str]" = OrderedDict()
+    _RENDER_CACHE_SIZE = 32
+    
     def __init__(self, 
                  include_toc: bool = True,
                  include_summary: bool = True,
@@ -80,7 +199,21 @@ class APIBeautifier:
         self.github_base_url = github_base_url
         self.github_branch = github_branch
         
-    def _endpoint_to_filename(self, method: str, endpoint: str) -> str:
+        # Preformatted footer timestamp; None means the time of each render
+        self._fixed_timestamp: Optional[str] = None
+        
+    def set_fixed_timestamp(self, timestamp: Optional[datetime]) -> None:
+        """
+        Stamp every report footer with the given time instead of the current one
+        
+        Useful for batch or CI runs that need reproducible output. Pass None to
+        go back to the time of each render.
+        """
+        self._fixed_timestamp = timestamp.strftime(_TIMESTAMP_FORMAT) if timestamp is not None else None
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _endpoint_to_filename(method: str, endpoint: str) -> str:
         """
         Convert HTTP method and endpoint path to filename format
         
@@ -91,128 +224,163 @@ class APIBeautifier:
         Returns:
             Filename string (e.g., POST__content_topics_topic_id_videos_upload.txt)
         """
-        # Remove leading slash
-        path = endpoint.lstrip('/')
-        
-        # Replace path separators with underscores
-        path = path.replace('/', '_')
-        
-        # Replace curly braces (path parameters) with underscores
-        path = re.sub(r'[{}]', '_', path)
-        
-        # Replace other special characters with underscores
-        path = re.sub(r'[^\w]', '_', path)
+        # Remove leading slash, then replace path separators, curly braces
+        # (path parameters) and other special characters with underscores
+        path = endpoint.lstrip('/').translate(_FILENAME_CHAR_TABLE)
         
         # Remove trailing underscores and clean up multiple underscores
-        path = re.sub(r'_+', '_', path).strip('_')
+        path = _UNDERSCORE_RUNS_RE.sub('_', path).strip('_')
         
         # Construct filename
         filename = f"{method}__{path}.txt"
         
         return filename
     
-    def _create_endpoint_link(self, method: str, endpoint: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _endpoint_link(base_url: str, branch: str, method: str, endpoint: str) -> str:
         """
-        Create a hyperlinked endpoint or plain text if no GitHub URL provided
+        Markdown link from an endpoint to its curl file
         
-        Args:
-            method: HTTP method
-            endpoint: Endpoint path
-            
-        Returns:
-            Markdown formatted link or plain text
+        The same endpoint is linked from its method section and the change
+        lists, so links are cached on everything that goes into them.
         """
-        if self.github_base_url:
-            filename = self._endpoint_to_filename(method, endpoint)
-            full_url = f"{self.github_base_url}/{self.github_branch}/{filename}"
-            return f"[`{endpoint}`]({full_url})"
-        else:
-            return f"`{endpoint}`"
+        filename = APIBeautifier._endpoint_to_filename(method, endpoint)
+        return f"[`{endpoint}`]({base_url}/{branch}/{filename})"
+    
+    @staticmethod
+    def _plain_endpoint_line(method: str, endpoint: str) -> str:
+        """List entry for an endpoint when hyperlinks are disabled"""
+        return f"- **`{method}`** `{endpoint}`\n"
+    
+    def _linked_endpoint_line(self, method: str, endpoint: str) -> str:
+        """List entry for an endpoint linked to its curl file; only used when github_base_url is set"""
+        link = self._endpoint_link(self.github_base_url, self.github_branch, method, endpoint)
+        return f"- **`{method}`** {link}\n"
     
     def parse_raw_text(self, raw_text: str) -> APIReport:
-        """Parse raw API summary text into structured data"""
-        lines = raw_text.strip().split('\n')
+        """
+        Parse raw API summary text into structured data
         
+        Endpoint lists come back sorted when sort_endpoints is set. Reports are
+        cached across instances, and every caller gets its own copy, so
+        changing a returned report never affects later calls.
+        """
+        key = (_text_digest(raw_text), self.sort_endpoints)
+        cache = self._parse_cache
+        report = cache.get(key)
+        if report is not None:
+            cache.move_to_end(key)
+            return report.copy()
+        
+        report = self._parse_lines(raw_text.strip().split('\n'), self.sort_endpoints)
+        cache[key] = report
+        if len(cache) > self._PARSE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return report.copy()
+    
+    def parse_lines(self, lines: Iterable[str]) -> APIReport:
+        """
+        Parse an API summary from an iterable of lines, such as an open file
+        
+        The lines are consumed one at a time and the result is not cached.
+        """
+        return self._parse_lines(lines, self.sort_endpoints)
+    
+    @staticmethod
+    def _parse_lines(lines: Iterable[str], sort_endpoints: bool = False) -> APIReport:
+        """Parse summary lines into an APIReport without consulting the cache"""
         # Extract basic info
-        total_endpoints = 0
-        added_endpoints = 0
-        modified_endpoints = 0
-        deleted_endpoints = 0
+        counts = dict.fromkeys(_COUNT_FIELDS.values(), 0)
         base_url = ""
         
-        endpoints_by_method = defaultdict(list)
-        deleted_list = []
-        added_list = []
-        modified_list = []
+        endpoints_by_method: Dict[str, List[str]] = {}
+        change_lists: Dict[str, List[str]] = {"deleted": [], "added": [], "modified": []}
         
         current_section = None
         current_method = None
         
+        # Bound once up front instead of looked up on every line; the append
+        # targets are rebound whenever the section or method changes
+        count_field_for = _COUNT_FIELDS.get
+        match_method_count = _METHOD_COUNT_RE.match
+        match_change_line = _CHANGE_LINE_RE.match
+        append_change = None
+        append_method_endpoint = None
+        
         for line in lines:
             line = line.strip()
             if not line:
                 continue
-                
-            # Extract summary numbers
-            if line.startswith("Total active endpoints:"):
-                total_endpoints = int(re.search(r'\d+', line).group())
-            elif line.startswith("Added endpoints:"):
-                added_endpoints = int(re.search(r'\d+', line).group())
-            elif line.startswith("Modified endpoints:"):
-                modified_endpoints = int(re.search(r'\d+', line).group())
-            elif line.startswith("Deleted endpoints:"):
-                deleted_endpoints = int(re.search(r'\d+', line).group())
-            elif line.startswith("Base URL:"):
-                base_url = line.split("Base URL: ")[1]
             
-            # Track sections
-            elif line == "DELETED ENDPOINTS:":
-                current_section = "deleted"
-                current_method = None
-            elif line == "ADDED ENDPOINTS:":
-                current_section = "added"
-                current_method = None
-            elif line == "MODIFIED ENDPOINTS:":
-                current_section = "modified"
-                current_method = None
-            elif line.startswith("Endpoints by method:"):
-                current_section = "methods"
-                current_method = None
+            # Header lines are recognised by the label before their first colon
+            label, colon, rest = line.partition(':')
+            if colon:
+                # Extract summary numbers
+                count_field = count_field_for(label)
+                if count_field:
+                    counts[count_field] = _parse_count(rest)
+                    continue
+                if label == "Base URL":
+                    # Only the first colon ends the label, so the scheme and
+                    # port colons of the URL stay in the value
+                    base_url = rest.strip()
+                    continue
+                
+                # Track sections
+                if not rest and label in _CHANGE_SECTION_HEADERS:
+                    current_section = _CHANGE_SECTION_HEADERS[label]
+                    current_method = None
+                    append_change = change_lists[current_section].append
+                    continue
+                if label == "Endpoints by method":
+                    current_section = "methods"
+                    current_method = None
+                    append_change = None
+                    continue
             
             # Parse method sections
-            elif current_section == "methods" and ":" in line and "endpoints" in line:
-                method_match = re.match(r'\s*(\w+):\s*(\d+)\s*endpoints?', line)
-                if method_match:
-                    current_method = method_match.group(1)
-            elif current_section == "methods" and line.startswith("- /") and current_method:
-                endpoint = line[2:].strip()  # Remove "- "
-                endpoints_by_method[current_method].append(endpoint)
+            if current_section == "methods":
+                if colon and "endpoints" in line:
+                    # "GET: 3 endpoints" as written by the generator; anything
+                    # less regular goes through the full pattern
+                    count, _, unit = rest.strip().partition(' ')
+                    if label.isalpha() and count.isdecimal() and unit.startswith("endpoint"):
+                        current_method = label
+                        append_method_endpoint = None
+                    else:
+                        method_match = match_method_count(line)
+                        if method_match:
+                            current_method = method_match.group(1)
+                            append_method_endpoint = None
+                elif line.startswith("- /") and current_method:
+                    # A method gets its list on its first endpoint, never before
+                    if append_method_endpoint is None:
+                        append_method_endpoint = endpoints_by_method.setdefault(current_method, []).append
+                    append_method_endpoint(line[2:].strip())  # Remove "- "
+                continue
             
             # Parse change sections
-            elif current_section in ["deleted", "added", "modified"] and line.startswith("- ") or \
-                 (current_section in ["deleted", "added", "modified"] and 
-                  re.match(r'\s*(GET|POST|PUT|DELETE|PATCH)\s+/', line)):
-                endpoint = line.strip()
-                if endpoint.startswith("- "):
-                    endpoint = endpoint[2:]
-                
-                if current_section == "deleted":
-                    deleted_list.append(endpoint)
-                elif current_section == "added":
-                    added_list.append(endpoint)
-                elif current_section == "modified":
-                    modified_list.append(endpoint)
-        
+            if append_change is not None:
+                if line.startswith("- "):
+                    append_change(line[2:])
+                elif line.startswith(_HTTP_VERBS) and match_change_line(line):
+                    append_change(line)
+        
+        # Sort each list once here rather than every time it is formatted
+        if sort_endpoints:
+            for endpoints in chain(endpoints_by_method.values(), change_lists.values()):
+                endpoints.sort()
+        
+        # Lists are frozen to tuples: reports are cached and shared, and never
+        # change after parsing
         return APIReport(
-            total_endpoints=total_endpoints,
-            added_endpoints_count=added_endpoints,
-            modified_endpoints_count=modified_endpoints,
-            deleted_endpoints_count=deleted_endpoints,
+            **counts,
             base_url=base_url,
-            endpoints_by_method=dict(endpoints_by_method),
-            deleted_endpoints=deleted_list,
-            added_endpoints=added_list,
-            modified_endpoints=modified_list
+            endpoints_by_method={method: tuple(endpoints) for method, endpoints in endpoints_by_method.items()},
+            deleted_endpoints=tuple(change_lists["deleted"]),
+            added_endpoints=tuple(change_lists["added"]),
+            modified_endpoints=tuple(change_lists["modified"])
         )
     
     def _generate_badges(self, report: APIReport) -> str:
@@ -242,168 +410,189 @@ class APIBeautifier:
         if not self.include_toc:
             return ""
             
-        toc = "## 📋 Table of Contents\n\n"
-        toc += "- [Executive Summary](#executive-summary)\n"
-        toc += "- [API Overview](#api-overview)\n"
-        toc += "- [Endpoints by HTTP Method](#endpoints-by-http-method)\n"
-        toc += "- [Recent Changes](#recent-changes)\n"
-        toc += "  - [Added Endpoints](#added-endpoints)\n"
-        toc += "  - [Modified Endpoints](#modified-endpoints)\n"
-        toc += "  - [Deleted Endpoints](#deleted-endpoints)\n"
+        toc: List[str] = [
+            "## 📋 Table of Contents\n\n",
+            "- [Executive Summary](#executive-summary)\n",
+            "- [API Overview](#api-overview)\n",
+            "- [Endpoints by HTTP Method](#endpoints-by-http-method)\n",
+            "- [Recent Changes](#recent-changes)\n",
+            "  - [Added Endpoints](#added-endpoints)\n",
+            "  - [Modified Endpoints](#modified-endpoints)\n",
+            "  - [Deleted Endpoints](#deleted-endpoints)\n",
+        ]
         if self.add_timestamps:
-            toc += "- [Report Information](#report-information)\n"
-        toc += "\n"
+            toc.append("- [Report Information](#report-information)\n")
+        toc.append("\n")
         
-        return toc
+        return "".join(toc)
     
     def _generate_summary(self, report: APIReport) -> str:
         """Generate executive summary"""
         if not self.include_summary:
             return ""
             
-        summary = "## 📊 Executive Summary\n\n"
-        summary += f"This API documentation covers **{report.total_endpoints}** active endpoints "
-        summary += f"across **{len(report.endpoints_by_method)}** HTTP methods.\n\n"
+        summary: List[str] = [
+            "## 📊 Executive Summary\n\n",
+            f"This API documentation covers **{report.total_endpoints}** active endpoints ",
+            f"across **{len(report.endpoints_by_method)}** HTTP methods.\n\n",
+        ]
         
         if any([report.added_endpoints_count, report.modified_endpoints_count, report.deleted_endpoints_count]):
-            summary += "### Recent Changes\n\n"
-            summary += f"- ✅ **{report.added_endpoints_count}** endpoints added\n"
-            summary += f"- 🔄 **{report.modified_endpoints_count}** endpoints modified\n"
-            summary += f"- ❌ **{report.deleted_endpoints_count}** endpoints deleted\n\n"
+            summary.append("### Recent Changes\n\n")
+            summary.append(f"- ✅ **{report.added_endpoints_count}** endpoints added\n")
+            summary.append(f"- 🔄 **{report.modified_endpoints_count}** endpoints modified\n")
+            summary.append(f"- ❌ **{report.deleted_endpoints_count}** endpoints deleted\n\n")
         
-        return summary
+        return "".join(summary)
     
-    def _generate_overview(self, report: APIReport) -> str:
-        """Generate API overview section"""
-        overview = "## 🌐 API Overview\n\n"
-        overview += f"**Base URL:** `{report.base_url}`\n\n"
-        
-        # Method distribution
-        overview += "### HTTP Methods Distribution\n\n"
-        overview += "| Method | Count | Percentage |\n"
-        overview += "|--------|-------|------------|\n"
-        
-        total = sum(len(endpoints) for endpoints in report.endpoints_by_method.values())
-        
-        for method in sorted(report.endpoints_by_method.keys()):
-            count = len(report.endpoints_by_method[method])
+    @staticmethod
+    def _method_stats(report: APIReport) -> List[_MethodStat]:
+        """Collect per-method statistics once, in REST order"""
+        total = report.grand_total
+        method_totals = report.method_totals
+        
+        stats = []
+        for method, endpoints in report.endpoints_by_method.items():
+            count = method_totals[method]
             percentage = (count / total * 100) if total > 0 else 0
-            overview += f"| `{method}` | {count} | {percentage:.1f}% |\n"
+            stats.append((method, endpoints, count, percentage, _METHOD_EMOJI.get(method, '🔗')))
         
-        overview += "\n"
-        return overview
+        stats.sort(key=lambda row: (_METHOD_RANK.get(row[0], len(_METHOD_RANK)), row[0]))
+        return stats
     
-    def _format_endpoint_list(self, endpoints: List[str], method: str = None) -> str:
+    def _generate_overview(self, report: APIReport, method_stats: List[_MethodStat]) -> str:
+        """Generate API overview section"""
+        # The distribution table lists methods alphabetically
+        rows = "".join([
+            _DISTRIBUTION_ROW_TEMPLATE % (method, count, percentage)
+            for method, _, count, percentage, _ in sorted(method_stats)
+        ])
+        
+        return (
+            "## 🌐 API Overview\n\n"
+            f"**Base URL:** `{report.base_url}`\n\n"
+            f"{_DISTRIBUTION_TABLE_HEADER}{rows}\n"
+        )
+    
+    def _format_endpoint_list(self, endpoints: Tuple[str, ...], method: str = None) -> str:
         """Format a list of endpoints with hyperlinks"""
         if not endpoints:
             return "_No endpoints_\n\n"
-            
-        if self.sort_endpoints:
-            endpoints = sorted(endpoints)
-        
-        formatted = ""
-        for endpoint in endpoints:
-            if method:
-                # For method-specific sections, create hyperlink
-                link = self._create_endpoint_link(method, endpoint)
-                formatted += f"- **`{method}`** {link}\n"
-            else:
-                # For change sections, parse method from endpoint if present
-                method_match = re.match(r'^(GET|POST|PUT|DELETE|PATCH)\s+(.+)$', endpoint)
-                if method_match:
-                    parsed_method = method_match.group(1)
-                    parsed_path = method_match.group(2)
-                    link = self._create_endpoint_link(parsed_method, parsed_path)
-                    formatted += f"- **`{parsed_method}`** {link}\n"
-                else:
-                    # Fallback to plain text if method not found
-                    formatted += f"- `{endpoint}`\n"
-        
-        return formatted + "\n"
-    
-    def _generate_endpoints_section(self, report: APIReport) -> str:
+        
+        if method and not self.github_base_url:
+            # Without hyperlinks every entry shares the same method prefix
+            prefix = f"- **`{method}`** `"
+            formatted = "".join([f"{prefix}{endpoint}`\n" for endpoint in endpoints])
+        elif method:
+            # For method-specific sections, create hyperlink
+            endpoint_line = self._linked_endpoint_line
+            formatted = "".join([endpoint_line(method, endpoint) for endpoint in endpoints])
+        else:
+            # Choose the line builder once per list rather than testing for links per line
+            endpoint_line = self._linked_endpoint_line if self.github_base_url else self._plain_endpoint_line
+            # For change sections, parse method from endpoint if present and
+            # fall back to plain text if method not found
+            method_matches = map(_METHOD_ENDPOINT_RE.match, endpoints)
+            formatted = "".join([
+                endpoint_line(*method_match.groups()) if method_match else f"- `{endpoint}`\n"
+                for endpoint, method_match in zip(endpoints, method_matches)
+            ])
+        
+        return f"{formatted}\n"
+    
+    def _generate_endpoints_section(self, method_stats: List[_MethodStat]) -> str:
         """Generate endpoints by method section"""
-        section = "## 🔌 Endpoints by HTTP Method\n\n"
-        
-        # Sort methods by common REST order
-        method_order = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
-        sorted_methods = []
-        
-        for method in method_order:
-            if method in report.endpoints_by_method:
-                sorted_methods.append(method)
-        
-        # Add any remaining methods
-        for method in sorted(report.endpoints_by_method.keys()):
-            if method not in sorted_methods:
-                sorted_methods.append(method)
-        
-        for method in sorted_methods:
-            endpoints = report.endpoints_by_method[method]
-            method_emoji = {
-                'GET': '📖', 'POST': '➕', 'PUT': '📝', 
-                'PATCH': '🔧', 'DELETE': '❌'
-            }.get(method, '🔗')
-            
-            section += f"### {method_emoji} {method} ({len(endpoints)} endpoints)\n\n"
-            section += self._format_endpoint_list(endpoints, method)
+        section: List[str] = ["## 🔌 Endpoints by HTTP Method\n\n"]
         
-        return section
+        for method, endpoints, count, _, method_emoji in method_stats:
+            section.append(
+                f"### {method_emoji} {method} ({count} endpoints)\n\n"
+                f"{self._format_endpoint_list(endpoints, method)}"
+            )
+        
+        return "".join(section)
     
     def _generate_changes_section(self, report: APIReport) -> str:
         """Generate recent changes section"""
-        section = "## 🔄 Recent Changes\n\n"
+        section: List[str] = ["## 🔄 Recent Changes\n\n"]
         
-        # Added endpoints
-        section += "### ✅ Added Endpoints\n\n"
-        if report.added_endpoints:
-            section += self._format_endpoint_list(report.added_endpoints)
-        else:
-            section += "_No endpoints added_\n\n"
+        # Added, modified and deleted endpoints; empty ones get their fixed text
+        for field_name, heading, empty_text in _CHANGE_SUBSECTIONS:
+            endpoints = getattr(report, field_name)
+            section.append(heading)
+            section.append(self._format_endpoint_list(endpoints) if endpoints else empty_text)
         
-        # Modified endpoints  
-        section += "### 🔄 Modified Endpoints\n\n"
-        if report.modified_endpoints:
-            section += self._format_endpoint_list(report.modified_endpoints)
-        else:
-            section += "_No endpoints modified_\n\n"
-        
-        # Deleted endpoints
-        section += "### ❌ Deleted Endpoints\n\n"
-        if report.deleted_endpoints:
-            section += self._format_endpoint_list(report.deleted_endpoints)
-        else:
-            section += "_No endpoints deleted_\n\n"
-        
-        return section
+        return "".join(section)
     
-    def _generate_footer(self) -> str:
+    def _generate_footer(self, generated: str) -> str:
         """Generate report footer"""
         if not self.add_timestamps:
             return ""
-            
-        footer = "## 📋 Report Information\n\n"
-        footer += f"- **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-        footer += f"- **Format:** {self.output_format.title()}\n"
+        
+        footer = f"## 📋 Report Information\n\n- **Generated:** {generated}\n- **Format:** {self.output_format.title()}\n"
         if self.github_base_url:
             footer += f"- **Hyperlinks:** Enabled (Branch: {self.github_branch})\n"
-
         return footer
     
+    def _iter_sections(self, report: APIReport) -> Iterator[str]:
+        """Yield the markdown document section by section"""
+        # Stamp the report once, as rendering starts
+        if self.add_timestamps:
+            generated = self._fixed_timestamp or datetime.now().strftime(_TIMESTAMP_FORMAT)
+        else:
+            generated = ""
+        
+        yield f"# {self.custom_title}\n\n"
+        yield self._generate_badges(report)
+        yield self._generate_toc()
+        yield self._generate_summary(report)
+        
+        method_stats = self._method_stats(report)
+        yield self._generate_overview(report, method_stats)
+        yield self._generate_endpoints_section(method_stats)
+        yield self._generate_changes_section(report)
+        yield self._generate_footer(generated)
+    
+    def beautify_iter(self, raw_text: str) -> Iterator[str]:
+        """
+        Beautify the API documentation as an iterator of markdown sections
+        
+        The raw text is parsed before this returns, so parse errors are raised
+        here rather than part-way through writing the output.
+        """
+        return self._iter_sections(self.parse_raw_text(raw_text))
+    
+    def beautify_lines_iter(self, lines: Iterable[str]) -> Iterator[str]:
+        """Like beautify_iter, but parse the summary from an iterable of lines"""
+        return self._iter_sections(self.parse_lines(lines))
+    
     def beautify(self, raw_text: str) -> str:
-        """Main method to beautify the API documentation"""
-        report = self.parse_raw_text(raw_text)
-        
-        # Build the markdown document
-        markdown = f"# {self.custom_title}\n\n"
-        markdown += self._generate_badges(report)
-        markdown += self._generate_toc()
-        markdown += self._generate_summary(report)
-        markdown += self._generate_overview(report)
-        markdown += self._generate_endpoints_section(report)
-        markdown += self._generate_changes_section(report)
-        markdown += self._generate_footer()
+        """
+        Main method to beautify the API documentation
         
+        Output is cached across calls unless the footer carries the current
+        time, which would make every render differ.
+        """
+        if self.add_timestamps and self._fixed_timestamp is None:
+            return "".join(self.beautify_iter(raw_text))
+        
+        settings = (
+            self.include_toc, self.include_summary, self.include_badges,
+            self.sort_endpoints, self.add_timestamps, self._fixed_timestamp,
+            self.custom_title, self.output_format,
+            self.github_base_url, self.github_branch,
+        )
+        key = (_text_digest(raw_text), settings)
+        cache = self._render_cache
+        markdown = cache.get(key)
+        if markdown is not None:
+            cache.move_to_end(key)
+            return markdown
+        
+        markdown = "".join(self.beautify_iter(raw_text))
+        cache[key] = markdown
+        if len(cache) > self._RENDER_CACHE_SIZE:
+            cache.popitem(last=False)
         return markdown
 
 
@@ -455,14 +644,12 @@ Examples:
     
     args = parser.parse_args()
     
-    # Read input
+    # Open input; it is parsed line by line rather than read in whole
     try:
-        input_path = Path(args.input)
-        if not input_path.exists():
-            print(f"Error: Input file '{args.input}' not found")
-            return 1
-            
-        raw_text = input_path.read_text(encoding='utf-8')
+        input_fp = Path(args.input).open(encoding='utf-8')
+    except (FileNotFoundError, NotADirectoryError):
+        print(f"Error: Input file '{args.input}' not found")
+        return 1
     except Exception as e:
         print(f"Error reading input file: {e}")
         return 1
@@ -482,24 +669,44 @@ Examples:
     )
     
     # Generate markdown
-    try:
-        markdown = beautifier.beautify(raw_text)
-    except Exception as e:
-        print(f"Error processing input: {e}")
-        return 1
+    with input_fp:
+        try:
+            sections = beautifier.beautify_lines_iter(input_fp)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error reading input file: {e}")
+            return 1
+        except Exception as e:
+            print(f"Error processing input: {e}")
+            return 1
     
     # Output result
+    if not args.output:
+        try:
+            markdown = "".join(sections)
+        except Exception as e:
+            print(f"Error processing input: {e}")
+            return 1
+        print(markdown)
+        return 0
+    
+    # Sections go to disk as they are generated, through a 1 MiB buffer, into
+    # a temporary file that only replaces the output once rendering finished
+    output_file = Path(args.output)
+    output_tmp = output_file.with_name(output_file.name + '.tmp')
     try:
-        if args.output:
-            output_path = Path(args.output)
-            output_path.write_text(markdown, encoding='utf-8')
-            print(f"✅ Documentation saved to {args.output}")
-        else:
-            print(markdown)
-    except Exception as e:
+        with open(output_tmp, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as output_fp:
+            output_fp.writelines(sections)
+        os.replace(output_tmp, output_file)
+    except OSError as e:
+        output_tmp.unlink(missing_ok=True)
         print(f"Error writing output: {e}")
         return 1
+    except Exception as e:
+        output_tmp.unlink(missing_ok=True)
+        print(f"Error processing input: {e}")
+        return 1
     
+    print(f"✅ Documentation saved to {args.output}")
     return 0
 
 